@@ -31,6 +31,11 @@ class Settings(BaseSettings):
     SECRET_KEY: str
     ENCRYPTION_KEY: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_TIMEOUT_SECONDS: int = 30
+    DB_POOL_PRE_PING: bool = True
 
     # =============================================================================
     # CORE & WEB SETTINGS
@@ -81,6 +86,15 @@ class Settings(BaseSettings):
     VESYNC_PASSWORD: str = ""
     OUTLET_TIMEOUT_SECONDS: int = 5
     OUTLET_MAX_RETRIES: int = 3
+    OUTLET_THREAD_POOL_SIZE: int = 64
+    VESYNC_STATE_CACHE_TTL_SECONDS: float = 1.0
+    VESYNC_DEVICE_STATE_TTL_SECONDS: float = 10.0
+    VESYNC_MAX_CONCURRENT: int = 8
+    OUTLET_STATE_STREAM_INTERVAL_SECONDS: float = 5.0
+    SMART_OUTLET_DRIVER_CACHE_SIZE: int = 256
+    SMART_OUTLET_DRIVER_IDLE_TIMEOUT: float = 300.0
+    SMART_OUTLET_DRIVER_MAX_AGE: float = 3600.0
+    OUTLET_STATUS_CACHE_TTL_SECONDS: float = 1.0
 
     # =============================================================================
     # TELEMETRY SERVICE SETTINGS
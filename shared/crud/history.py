@@ -5,23 +5,59 @@ This module provides database operations for querying historical data
 from both the raw history table and the hourly aggregates table.
 """
 
-from datetime import datetime, timedelta
-from typing import List, Optional
-from sqlalchemy import select, and_, desc
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from sqlalchemy import select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import text
 
 from shared.db.models import History, HistoryHourlyAggregate, Device
 
+# The *_json readers below have PostgreSQL build the whole response array, so
+# rows go straight from the database to the client without ORM objects or dicts
+_RAW_HISTORY_JSON_SQL = text("""
+    SELECT COALESCE(json_agg(t ORDER BY t.timestamp DESC), '[]'::json)::text
+    FROM (
+        SELECT id, device_id, timestamp, value, json_value, history_metadata
+        FROM history
+        WHERE device_id = :device_id
+            AND timestamp >= :start_time
+            AND value IS NOT NULL
+        ORDER BY timestamp DESC
+        LIMIT :limit
+    ) t
+""")
 
-async def get_raw_history(
+# Keyset pagination: each page resumes after the last hour_timestamp of the previous
+# one, so a page is an index seek on (device_id, hour_timestamp) however deep it is
+_HOURLY_HISTORY_PAGE_JSON_SQL = text("""
+    SELECT json_build_object(
+        'items', COALESCE(json_agg(t ORDER BY t.hour_timestamp), '[]'::json),
+        'next_cursor', CASE WHEN count(*) = :limit THEN max(t.hour_timestamp) END
+    )::text
+    FROM (
+        SELECT id, device_id, hour_timestamp, avg_value, min_value, max_value, sample_count, created_at
+        FROM history_hourly_aggregates
+        WHERE device_id = :device_id
+            AND hour_timestamp >= :start_time
+            AND hour_timestamp <= :end_time
+            AND hour_timestamp > COALESCE(:cursor, '-infinity'::timestamptz)
+        ORDER BY hour_timestamp
+        LIMIT :limit
+    ) t
+""")
+
+
+async def get_raw_history_json(
     session: AsyncSession,
     device_id: int,
     hours: int = 24,
     limit: int = 1000
-) -> List[History]:
+) -> str:
     """
-    Fetch raw historical data for a specific device.
+    Fetch raw historical data for a device as a pre-serialized JSON array.
+    
+    Only records with a value are returned; PostgreSQL encodes the array.
     
     Args:
         session: Database session
@@ -30,60 +66,55 @@ async def get_raw_history(
         limit: Maximum number of records to return (default: 1000)
         
     Returns:
-        List of History records ordered by timestamp (newest first)
+        JSON array text of history records ordered by timestamp (newest first)
     """
-    # Calculate the start time based on hours parameter
-    start_time = datetime.utcnow() - timedelta(hours=hours)
+    start_time = datetime.now(timezone.utc) - timedelta(hours=hours)
     
-    # Build the query
-    query = select(History).where(
-        and_(
-            History.device_id == device_id,
-            History.timestamp >= start_time,
-            History.value.is_not(None)  # Only return records with actual values
-        )
-    ).order_by(desc(History.timestamp)).limit(limit)
-    
-    result = await session.execute(query)
-    return result.scalars().all()
+    result = await session.execute(_RAW_HISTORY_JSON_SQL, {
+        "device_id": device_id,
+        "start_time": start_time,
+        "limit": limit
+    })
+    return result.scalar_one()
 
 
-async def get_hourly_history(
+async def get_hourly_history_json(
     session: AsyncSession,
     device_id: int,
     start_date: str,
-    end_date: str
-) -> List[HistoryHourlyAggregate]:
+    end_date: str,
+    cursor: Optional[datetime] = None,
+    limit: int = 500
+) -> str:
     """
-    Fetch hourly aggregated historical data for a specific device.
+    Fetch one page of hourly aggregated data for a device as pre-serialized JSON.
     
     Args:
         session: Database session
         device_id: ID of the device to fetch history for
         start_date: Start date in ISO format (YYYY-MM-DD)
         end_date: End date in ISO format (YYYY-MM-DD)
+        cursor: Return only hours after this one (the previous page's next_cursor)
+        limit: Maximum number of records to return (default: 500)
         
     Returns:
-        List of HistoryHourlyAggregate records ordered by hour_timestamp
+        JSON object text with "items" (hourly aggregate records ordered by
+        hour_timestamp) and "next_cursor" (null on the last page)
     """
     try:
-        # Parse the date strings
         start_datetime = datetime.fromisoformat(f"{start_date}T00:00:00")
         end_datetime = datetime.fromisoformat(f"{end_date}T23:59:59")
     except ValueError as e:
         raise ValueError(f"Invalid date format. Use YYYY-MM-DD format. Error: {e}")
     
-    # Build the query
-    query = select(HistoryHourlyAggregate).where(
-        and_(
-            HistoryHourlyAggregate.device_id == device_id,
-            HistoryHourlyAggregate.hour_timestamp >= start_datetime,
-            HistoryHourlyAggregate.hour_timestamp <= end_datetime
-        )
-    ).order_by(HistoryHourlyAggregate.hour_timestamp)
-    
-    result = await session.execute(query)
-    return result.scalars().all()
+    result = await session.execute(_HOURLY_HISTORY_PAGE_JSON_SQL, {
+        "device_id": device_id,
+        "start_time": start_datetime,
+        "end_time": end_datetime,
+        "cursor": cursor,
+        "limit": limit
+    })
+    return result.scalar_one()
 
 
 async def get_device_by_id(
@@ -10,12 +10,14 @@ This module provides:
 
 from typing import AsyncGenerator
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.orm import declarative_base
-from sqlalchemy.pool import NullPool
+from sqlalchemy.ext.asyncio import AsyncAttrs
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from shared.core.config import settings
 
-# SQLAlchemy declarative base
-Base = declarative_base()
+# SQLAlchemy declarative base; AsyncAttrs adds `await obj.awaitable_attrs.<relationship>`
+class Base(AsyncAttrs, DeclarativeBase):
+    pass
 
 # Database URL with asyncpg driver
 DATABASE_URL = str(settings.DATABASE_URL).replace("postgresql://", "postgresql+asyncpg://")
@@ -24,11 +26,12 @@ DATABASE_URL = str(settings.DATABASE_URL).replace("postgresql://", "postgresql+a
 engine = create_async_engine(
     DATABASE_URL,
     # TODO: If you need SQL echo for debugging, set echo=True here manually
-    pool_size=10,
-    max_overflow=20,
-    pool_pre_ping=True,
-    pool_recycle=3600,
-    pool_timeout=30,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+    pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
 )
 
 # Async session factory
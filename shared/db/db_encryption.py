@@ -6,11 +6,12 @@ like authentication information before storing in the database. Uses Fernet
 symmetric encryption and supports safe, reusable encryption for JSON fields.
 """
 
-import json
 import logging
 from base64 import b64encode, b64decode
+from functools import lru_cache
 from typing import Any, Optional
 
+import orjson
 from cryptography.fernet import Fernet
 from sqlalchemy import TypeDecorator, Text
 from sqlalchemy.types import TypeEngine
@@ -27,6 +28,30 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _get_fernet(encryption_key: str) -> Fernet:
+    """
+    Build the Fernet cipher for an encryption key.
+    
+    Cached so every EncryptedJSON column, and every copy SQLAlchemy makes of
+    one, shares a single cipher instead of re-deriving it from the key.
+    """
+    # Ensure the key is properly formatted for Fernet (32 bytes, base64 encoded)
+    key = encryption_key.encode('utf-8')
+    
+    # If key is not 32 bytes, pad or truncate it
+    if len(key) != 32:
+        if len(key) < 32:
+            # Pad with zeros if too short
+            key = key.ljust(32, b'\0')
+        else:
+            # Truncate if too long
+            key = key[:32]
+    
+    # Encode to base64 for Fernet
+    return Fernet(b64encode(key))
+
+
 class EncryptedJSON(TypeDecorator):
     """
     SQLAlchemy TypeDecorator for storing encrypted JSON data.
@@ -49,25 +74,10 @@ class EncryptedJSON(TypeDecorator):
     
     def _initialize_fernet(self):
         """
-        Initialize the Fernet cipher with the encryption key from settings.
+        Attach the shared Fernet cipher for the configured encryption key.
         """
         try:
-            # Ensure the key is properly formatted for Fernet (32 bytes, base64 encoded)
-            key = settings.ENCRYPTION_KEY.encode('utf-8')
-            
-            # If key is not 32 bytes, pad or truncate it
-            if len(key) != 32:
-                if len(key) < 32:
-                    # Pad with zeros if too short
-                    key = key.ljust(32, b'\0')
-                else:
-                    # Truncate if too long
-                    key = key[:32]
-            
-            # Encode to base64 for Fernet
-            key_b64 = b64encode(key)
-            self._fernet = Fernet(key_b64)
-            
+            self._fernet = _get_fernet(settings.ENCRYPTION_KEY)
         except Exception as e:
             logger.error(f"Failed to initialize Fernet cipher: {e}")
             raise ValueError(f"Invalid encryption key configuration: {e}")
@@ -87,11 +97,8 @@ class EncryptedJSON(TypeDecorator):
             return None
         
         try:
-            # Serialize to JSON string
-            json_str = json.dumps(value, ensure_ascii=False)
-            
-            # Encrypt the JSON string
-            encrypted_data = self._fernet.encrypt(json_str.encode('utf-8'))
+            # Serialize straight to UTF-8 JSON bytes and encrypt them
+            encrypted_data = self._fernet.encrypt(orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS))
             
             # Return base64-encoded encrypted data
             return b64encode(encrypted_data).decode('utf-8')
@@ -121,8 +128,8 @@ class EncryptedJSON(TypeDecorator):
             # Decrypt the data
             decrypted_data = self._fernet.decrypt(encrypted_data)
             
-            # Parse JSON and return
-            return json.loads(decrypted_data.decode('utf-8'))
+            # Parse JSON and return; orjson reads the bytes directly
+            return orjson.loads(decrypted_data)
             
         except Exception as e:
             logger.error(f"Failed to decrypt auth_info: {e}")
@@ -4,10 +4,11 @@ from sqlalchemy import (
     JSON, Float, Text, ARRAY, LargeBinary, UniqueConstraint
 )
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql import func, text
 from sqlalchemy.types import TypeDecorator, TEXT
-from uuid import uuid4
+from typing import Any, List, Optional
+from uuid import UUID as PyUUID, uuid4
 from datetime import datetime
 
 from shared.db.database import Base
@@ -88,6 +89,14 @@ class History(Base):
     history_metadata = Column(JSON, nullable=True)
     device = relationship("Device", back_populates="history")
 
+    __table_args__ = (
+        # Covering index for the hourly roll-up window; rows without a value are left out
+        Index(
+            'ix_history_timestamp_device_value', 'timestamp', 'device_id',
+            postgresql_include=['value'], postgresql_where=text('value IS NOT NULL')
+        ),
+    )
+
 
 class HistoryHourlyAggregate(Base):
     __tablename__ = "history_hourly_aggregates"
@@ -188,35 +197,42 @@ class DeviceAction(Base):
 
 class SmartOutlet(Base):
     __tablename__ = "smart_outlets"
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    driver_type = Column(String(50), nullable=False)
-    driver_device_id = Column(String(255), nullable=False)
-    vesync_account_id = Column(Integer, ForeignKey('vesync_accounts.id'), nullable=True)
-    name = Column(String(255), nullable=False)
-    nickname = Column(String(255), nullable=True)
-    ip_address = Column(String(45), nullable=False)
-    auth_info = Column(EncryptedJSON(), nullable=True)
-    location = Column(String(255), nullable=True)
-    role = Column(String(50), nullable=False, default="general")
-    enabled = Column(Boolean, nullable=False, default=True)
-    poller_enabled = Column(Boolean, nullable=False, default=True)
-    scheduler_enabled = Column(Boolean, nullable=False, default=True)
-    is_online = Column(Boolean, nullable=True)
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
-    __table_args__ = (UniqueConstraint('driver_type', 'driver_device_id', name='uq_driver_device'),)
-    vesync_account = relationship("VeSyncAccount", back_populates="devices")
+    id: Mapped[PyUUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    driver_type: Mapped[str] = mapped_column(String(50))
+    driver_device_id: Mapped[str] = mapped_column(String(255))
+    vesync_account_id: Mapped[Optional[int]] = mapped_column(ForeignKey('vesync_accounts.id'))
+    name: Mapped[str] = mapped_column(String(255))
+    nickname: Mapped[Optional[str]] = mapped_column(String(255))
+    ip_address: Mapped[str] = mapped_column(String(45))
+    auth_info: Mapped[Optional[Any]] = mapped_column(EncryptedJSON())
+    location: Mapped[Optional[str]] = mapped_column(String(255))
+    role: Mapped[str] = mapped_column(String(50), default="general")
+    enabled: Mapped[bool] = mapped_column(default=True)
+    poller_enabled: Mapped[bool] = mapped_column(default=True)
+    scheduler_enabled: Mapped[bool] = mapped_column(default=True)
+    is_online: Mapped[Optional[bool]]
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    __table_args__ = (
+        UniqueConstraint('driver_type', 'driver_device_id', name='uq_driver_device'),
+        # Enabled-outlet listings, optionally filtered by driver type
+        Index('ix_smart_outlets_enabled_driver_type', 'driver_type', postgresql_where=text('enabled')),
+        Index('ix_smart_outlets_vesync_account_id', 'vesync_account_id'),
+    )
+    # Fetch server-generated timestamps in the INSERT's RETURNING clause
+    __mapper_args__ = {"eager_defaults": True}
+    vesync_account: Mapped[Optional["VeSyncAccount"]] = relationship(back_populates="devices", lazy="selectin")
 
 
 class VeSyncAccount(Base):
     __tablename__ = "vesync_accounts"
-    id = Column(Integer, primary_key=True, index=True)
-    email = Column(String, nullable=False, unique=True, index=True)
-    password_encrypted = Column(LargeBinary, nullable=False)
-    time_zone = Column(String, nullable=False)
-    is_active = Column(Boolean, default=True, nullable=False)
-    last_sync_status = Column(String, default="Pending")
-    last_synced_at = Column(DateTime(timezone=True), onupdate=func.now())
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    devices = relationship("SmartOutlet", back_populates="vesync_account")
\ No newline at end of file
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    email: Mapped[str] = mapped_column(String, unique=True, index=True)
+    password_encrypted: Mapped[bytes] = mapped_column(LargeBinary)
+    time_zone: Mapped[str] = mapped_column(String)
+    is_active: Mapped[bool] = mapped_column(default=True)
+    last_sync_status: Mapped[Optional[str]] = mapped_column(String, default="Pending")
+    last_synced_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), onupdate=func.now())
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), onupdate=func.now())
+    devices: Mapped[List["SmartOutlet"]] = relationship(back_populates="vesync_account")
\ No newline at end of file
@@ -14,7 +14,10 @@ from .exceptions import (
     DriverNotImplementedError,
     OutletConnectionError,
     OutletTimeoutError,
-    OutletAuthenticationError
+    OutletAuthenticationError,
+    OutletDisabledError,
+    DiscoveryInProgressError,
+    DiscoveryFailedError
 )
 
 __all__ = [
@@ -30,5 +33,8 @@ __all__ = [
     "DriverNotImplementedError",
     "OutletConnectionError",
     "OutletTimeoutError",
-    "OutletAuthenticationError"
+    "OutletAuthenticationError",
+    "OutletDisabledError",
+    "DiscoveryInProgressError",
+    "DiscoveryFailedError"
 ] 
\ No newline at end of file
@@ -6,15 +6,20 @@ creation, update, control, and discovery of smart outlets. All endpoints
 are documented for OpenAPI/Swagger UI.
 """
 
-from uuid import uuid4
-from typing import List, Optional
+from uuid import UUID, uuid4
+from typing import Any, Dict, List, Optional, Type
 import asyncio
 from datetime import datetime
 import pytz
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Header, Response
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Header, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ValidationError
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from pyvesync import VeSync
 
 from shared.db.database import async_session
@@ -24,14 +29,16 @@ from shared.db.models import SmartOutlet, VeSyncAccount
 from .schemas import (
     SmartOutletCreate, SmartOutletRead, SmartOutletState, SmartOutletUpdate,
     VeSyncDiscoveryRequest, DiscoveredDevice, DiscoveryTaskResponse, DiscoveryResults,
-    VeSyncAccountCreate, VeSyncAccountRead, DiscoveredVeSyncDevice, VeSyncDeviceCreate, SmartOutletWithState
+    VeSyncAccountCreate, VeSyncAccountRead, DiscoveredVeSyncDevice, VeSyncDeviceCreate, SmartOutletWithState,
+    READ_LIST_ADAPTER
 )
 from .exceptions import OutletNotFoundError, OutletConnectionError, OutletAuthenticationError
 from .handlers import register_exception_handlers
 from .discovery_service import DiscoveryService
+from .broadcaster import StateBroadcaster
 from shared.core.config import settings
 from .crypto_utils import encrypt_vesync_password, decrypt_vesync_password
-from .services.vesync_device_service import vesync_device_service
+from .services.vesync_device_service import get_vesync_device_service
 from shared.api.deps import get_current_user_or_service
 from shared.schemas.user import User
 
@@ -40,16 +47,91 @@ router = APIRouter()
 # Global discovery service instance
 discovery_service = DiscoveryService()
 
+def _model_response(model: BaseModel) -> Response:
+    """
+    Serialize a schema with pydantic's Rust serializer straight to a JSON response.
+
+    Skips FastAPI's response-model pass, which would dump to Python objects and
+    then encode them a second time.
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
+def _outlets_response(outlets: List[SmartOutlet]) -> Response:
+    """
+    Serialize SmartOutlet rows as a JSON array of SmartOutletRead in one serializer call.
+    """
+    body = READ_LIST_ADAPTER.dump_json([SmartOutletRead.from_orm_fast(outlet) for outlet in outlets])
+    return Response(content=body, media_type="application/json")
+
+
+def _json_body_schema(model: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    Build an OpenAPI requestBody for a model parsed by hand, with its $defs inlined.
+
+    Routes that read the raw body declare no body parameter, so FastAPI would
+    otherwise leave the request schema out of the docs.
+    """
+    schema = model.model_json_schema()
+    defs = schema.pop("$defs", {})
+
+    def _inline(node: Any) -> Any:
+        if isinstance(node, dict):
+            resolved = {key: _inline(value) for key, value in node.items() if key != "$ref"}
+            if "$ref" in node:
+                resolved = {**_inline(defs[node["$ref"].rsplit("/", 1)[-1]]), **resolved}
+            return resolved
+        if isinstance(node, list):
+            return [_inline(item) for item in node]
+        return node
+
+    return {"requestBody": {"required": True, "content": {"application/json": {"schema": _inline(schema)}}}}
+
+
+async def parse_outlet_create(request: Request) -> SmartOutletCreate:
+    """
+    Dependency parsing a SmartOutletCreate straight from the raw request body.
+
+    model_validate_json parses and validates in one pass inside pydantic-core,
+    instead of decoding to a dict first and validating that.
+    """
+    try:
+        return SmartOutletCreate.model_validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+        )
+
+
+# Process-wide manager, created on first use so its driver cache outlives a single request
+_smart_outlet_manager: Optional[SmartOutletManager] = None
+
 
 async def get_smart_outlet_manager() -> SmartOutletManager:
     """
-    Dependency to provide a SmartOutletManager instance.
+    Dependency to provide the shared SmartOutletManager instance.
 
     Returns:
         SmartOutletManager: The manager instance
     """
-    logger = get_logger(__name__)
-    return SmartOutletManager(async_session, logger)
+    global _smart_outlet_manager
+    if _smart_outlet_manager is None:
+        _smart_outlet_manager = SmartOutletManager(async_session, get_logger(__name__))
+    return _smart_outlet_manager
+
+
+async def close_smart_outlet_manager() -> None:
+    """
+    Close the shared SmartOutletManager, if one was created, and its drivers.
+    """
+    global _smart_outlet_manager
+    if _smart_outlet_manager is not None:
+        await _smart_outlet_manager.close()
+        _smart_outlet_manager = None
+
+
+# Global state broadcaster instance feeding the state stream endpoint
+state_broadcaster = StateBroadcaster(get_smart_outlet_manager, settings.OUTLET_STATE_STREAM_INTERVAL_SECONDS)
 
 
 async def get_db_session() -> AsyncSession:
@@ -69,10 +151,11 @@ async def get_db_session() -> AsyncSession:
     status_code=status.HTTP_201_CREATED,
     summary="Create a new smart outlet",
     description="Creates a new smart outlet record in the database and registers it with the manager.",
-    tags=["Smart Outlets"]
+    tags=["Smart Outlets"],
+    openapi_extra=_json_body_schema(SmartOutletCreate)
 )
 async def create_outlet(
-    outlet_data: SmartOutletCreate,
+    outlet_data: SmartOutletCreate = Depends(parse_outlet_create),
     manager: SmartOutletManager = Depends(get_smart_outlet_manager),
     session: AsyncSession = Depends(get_db_session),
     current_user: User = Depends(get_current_user_or_service)
@@ -124,7 +207,6 @@ async def create_outlet(
     
     session.add(outlet)
     await session.commit()
-    await session.refresh(outlet)
     
     # Register outlet with manager
     try:
@@ -133,7 +215,7 @@ async def create_outlet(
         # Log error but don't fail the creation
         pass
     
-    return SmartOutletRead.model_validate(outlet)
+    return SmartOutletRead.from_orm_fast(outlet)
 
 
 @router.get(
@@ -161,10 +243,10 @@ async def list_outlets(
     Returns:
         List[SmartOutletRead]: List of outlet data
     """
-    outlets = await manager.get_all_outlets(
+    outlets = await manager.list_outlets_fast(
         include_disabled=include_disabled, driver_type=driver_type
     )
-    return [SmartOutletRead.model_validate(outlet) for outlet in outlets]
+    return Response(content=READ_LIST_ADAPTER.dump_json(outlets), media_type="application/json")
 
 
 @router.delete(
@@ -174,7 +256,7 @@ async def list_outlets(
     tags=["Smart Outlets"],
 )
 async def delete_outlet(
-    outlet_id: str,
+    outlet_id: UUID,
     manager: SmartOutletManager = Depends(get_smart_outlet_manager),
     current_user: User = Depends(get_current_user_or_service),
 ):
@@ -197,7 +279,7 @@ async def delete_outlet(
     tags=["Smart Outlets"]
 )
 async def update_outlet(
-    outlet_id: str,
+    outlet_id: UUID,
     update_data: SmartOutletUpdate,
     manager: SmartOutletManager = Depends(get_smart_outlet_manager),
     current_user: User = Depends(get_current_user_or_service)
@@ -214,7 +296,7 @@ async def update_outlet(
     Returns:
         SmartOutletRead: Updated outlet data
     """
-    return await manager.update_outlet(outlet_id, update_data)
+    return _model_response(await manager.update_outlet(outlet_id, update_data))
 
 
 @router.get(
@@ -225,7 +307,7 @@ async def update_outlet(
     tags=["State"]
 )
 async def get_outlet_state(
-    outlet_id: str,
+    outlet_id: UUID,
     manager: SmartOutletManager = Depends(get_smart_outlet_manager),
     current_user: User = Depends(get_current_user_or_service)
 ):
@@ -240,7 +322,43 @@ async def get_outlet_state(
     Returns:
         SmartOutletState: Current outlet state
     """
-    return await manager.get_outlet_status(outlet_id)
+    return _model_response(SmartOutletState.from_dataclass(await manager.get_outlet_status(outlet_id)))
+
+
+@router.get(
+    "/state/stream",
+    summary="Stream smart outlet states",
+    description="Server-Sent Events stream of state updates for all enabled outlets, polled once per interval for all subscribers.",
+    tags=["State"]
+)
+async def stream_outlet_states(
+    current_user: User = Depends(get_current_user_or_service)
+):
+    """
+    Stream outlet states as Server-Sent Events.
+
+    Each event's data is a JSON object with ``outlet_id`` and ``state`` keys.
+
+    Args:
+        current_user: Current authenticated user or service
+
+    Returns:
+        StreamingResponse: text/event-stream response
+    """
+    async def _events():
+        queue = state_broadcaster.subscribe()
+        try:
+            while True:
+                event = await queue.get()
+                yield b"data: " + orjson.dumps(event) + b"\n\n"
+        finally:
+            state_broadcaster.unsubscribe(queue)
+
+    return StreamingResponse(
+        _events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"}
+    )
 
 
 @router.post(
@@ -251,7 +369,7 @@ async def get_outlet_state(
     tags=["Control"]
 )
 async def turn_on_outlet(
-    outlet_id: str,
+    outlet_id: UUID,
     manager: SmartOutletManager = Depends(get_smart_outlet_manager),
     current_user: User = Depends(get_current_user_or_service)
 ):
@@ -284,7 +402,7 @@ async def turn_on_outlet(
     tags=["Control"]
 )
 async def turn_off_outlet(
-    outlet_id: str,
+    outlet_id: UUID,
     manager: SmartOutletManager = Depends(get_smart_outlet_manager),
     current_user: User = Depends(get_current_user_or_service)
 ):
@@ -317,7 +435,7 @@ async def turn_off_outlet(
     tags=["Control"]
 )
 async def toggle_outlet(
-    outlet_id: str,
+    outlet_id: UUID,
     manager: SmartOutletManager = Depends(get_smart_outlet_manager),
     current_user: User = Depends(get_current_user_or_service)
 ):
@@ -342,7 +460,7 @@ async def toggle_outlet(
         )
     
     # Return the current state after toggle
-    return await manager.get_outlet_status(outlet_id)
+    return _model_response(SmartOutletState.from_dataclass(await manager.get_outlet_status(outlet_id)))
 
 
 # Discovery Endpoints
@@ -392,14 +510,15 @@ async def get_local_discovery_results(task_id: str):
             detail=f"Discovery task {task_id} not found",
         )
 
-    return DiscoveryResults(
+    # The discovery task stores validated DiscoveredDevice instances, so skip revalidation
+    return _model_response(DiscoveryResults.model_construct(
         task_id=task_id,
         status=result_data.get("status", "unknown"),
         created_at=result_data.get("created_at"),
         completed_at=result_data.get("completed_at"),
-        results=[DiscoveredDevice(**dev) for dev in result_data.get("results", [])],
+        results=result_data.get("results", []),
         error=result_data.get("error"),
-    )
+    ))
 
 
 @router.post(
@@ -487,9 +606,9 @@ async def discover_vesync_devices(
 # VeSync Account Management Router
 # =============================================================================
 
-async def get_vesync_account_or_404(account_id: int, db: AsyncSession) -> VeSyncAccount:
-    """Helper to fetch a VeSync account by ID or raise HTTPException 404."""
-    result = await db.execute(select(VeSyncAccount).filter(VeSyncAccount.id == account_id))
+async def get_vesync_account_or_404(account_id: int, db: AsyncSession, *options: Any) -> VeSyncAccount:
+    """Helper to fetch a VeSync account by ID or raise HTTPException 404; extra loader options are applied to the query."""
+    result = await db.execute(select(VeSyncAccount).options(*options).filter(VeSyncAccount.id == account_id))
     db_account = result.scalars().first()
     if db_account is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="VeSync account not found")
@@ -566,7 +685,8 @@ async def delete_vesync_account(
     """
     Delete a VeSync account.
     """
-    db_account = await get_vesync_account_or_404(account_id, db)
+    # The account's outlets must be loaded so the delete can null their foreign keys
+    db_account = await get_vesync_account_or_404(account_id, db, selectinload(VeSyncAccount.devices))
     await db.delete(db_account)
     await db.commit()
     return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -634,7 +754,7 @@ async def discover_vesync_devices_for_account(
     account = await get_vesync_account_or_404(account_id, db)
     
     # Discover all devices from VeSync cloud
-    cloud_devices = await vesync_device_service.discover_devices(account)
+    cloud_devices = await get_vesync_device_service().discover_devices(account)
     
     # Get list of already managed devices for this account
     managed_devices_result = await db.execute(
@@ -668,8 +788,8 @@ async def add_vesync_device(
     # Get the VeSync account
     account = await get_vesync_account_or_404(account_id, db)
     
-    # Verify the device exists in VeSync cloud
-    cloud_devices = await vesync_device_service.discover_devices(account)
+    # Verify the device exists in VeSync cloud; only the device list is needed
+    cloud_devices = await get_vesync_device_service().discover_devices(account, refresh=False)
     device_exists = any(device.vesync_device_id == device_data.vesync_device_id for device in cloud_devices)
     
     if not device_exists:
@@ -725,9 +845,8 @@ async def add_vesync_device(
     
     db.add(outlet)
     await db.commit()
-    await db.refresh(outlet)
     
-    return SmartOutletRead.model_validate(outlet)
+    return SmartOutletRead.from_orm_fast(outlet)
 
 
 @vesync_router.get("/{account_id}/devices", response_model=List[SmartOutletRead])
@@ -750,7 +869,7 @@ async def list_vesync_devices(
         )
     )
     devices = result.scalars().all()
-    return [SmartOutletRead.model_validate(device) for device in devices]
+    return _outlets_response(devices)
 
 
 @vesync_router.get("/{account_id}/devices/{device_id}", response_model=SmartOutletWithState)
@@ -783,10 +902,10 @@ async def get_vesync_device_state(
     
     # Get real-time state from VeSync
     try:
-        state = await vesync_device_service.get_device_state(account, device.driver_device_id)
+        state = await get_vesync_device_service().get_device_state(account, device.driver_device_id)
         
         # Combine database data with real-time state
-        device_data = SmartOutletRead.model_validate(device).model_dump()
+        device_data = SmartOutletRead.from_orm_fast(device).model_dump()
         device_data.update(state)
         
         return SmartOutletWithState(**device_data)
@@ -828,13 +947,13 @@ async def turn_on_vesync_device(
     
     # Turn on the device
     try:
-        await vesync_device_service.turn_device_on(account, device.driver_device_id)
+        await get_vesync_device_service().turn_device_on(account, device.driver_device_id)
         
         # Get updated state
-        state = await vesync_device_service.get_device_state(account, device.driver_device_id)
+        state = await get_vesync_device_service().get_device_state(account, device.driver_device_id)
         
         # Combine database data with real-time state
-        device_data = SmartOutletRead.model_validate(device).model_dump()
+        device_data = SmartOutletRead.from_orm_fast(device).model_dump()
         device_data.update(state)
         
         return SmartOutletWithState(**device_data)
@@ -876,13 +995,13 @@ async def turn_off_vesync_device(
     
     # Turn off the device
     try:
-        await vesync_device_service.turn_device_off(account, device.driver_device_id)
+        await get_vesync_device_service().turn_device_off(account, device.driver_device_id)
         
         # Get updated state
-        state = await vesync_device_service.get_device_state(account, device.driver_device_id)
+        state = await get_vesync_device_service().get_device_state(account, device.driver_device_id)
         
         # Combine database data with real-time state
-        device_data = SmartOutletRead.model_validate(device).model_dump()
+        device_data = SmartOutletRead.from_orm_fast(device).model_dump()
         device_data.update(state)
         
         return SmartOutletWithState(**device_data)
@@ -0,0 +1,92 @@
+"""
+SmartOutlet State Broadcaster
+
+This module provides a single background poller that fans outlet state out to
+any number of streaming subscribers, so N clients watching M outlets cost M
+device reads per interval instead of N x M.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+from shared.utils.logger import get_logger
+from .manager import SmartOutletManager
+
+
+# Events buffered per subscriber before the oldest are dropped for a slow client
+SUBSCRIBER_QUEUE_SIZE = 100
+
+
+class StateBroadcaster:
+    """
+    Polls every enabled outlet on an interval and publishes each state to subscribers.
+
+    The poll loop starts with the first subscriber and exits once the last one
+    unsubscribes, so an idle service makes no device calls.
+    """
+
+    def __init__(self, manager_factory: Callable[[], Awaitable[SmartOutletManager]], interval: float):
+        """
+        Initialize the broadcaster.
+
+        Args:
+            manager_factory: Coroutine function returning the shared SmartOutletManager
+            interval: Seconds between polling rounds
+        """
+        self._manager_factory = manager_factory
+        self._interval = interval
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._task: Optional[asyncio.Task] = None
+        self._logger = get_logger(__name__)
+
+    def subscribe(self) -> asyncio.Queue:
+        """
+        Register a new subscriber and make sure the poll loop is running.
+
+        Returns:
+            asyncio.Queue: Queue receiving state events for this subscriber
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self._subscribers.add(queue)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        """
+        Remove a subscriber; the poll loop stops after its current round if none remain.
+        """
+        self._subscribers.discard(queue)
+
+    async def stop(self) -> None:
+        """
+        Cancel the poll loop and drop all subscribers.
+        """
+        self._subscribers.clear()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def _publish(self, event: Dict[str, Any]) -> None:
+        for queue in self._subscribers:
+            if queue.full():
+                # Slow client: drop its oldest event rather than block everyone else
+                queue.get_nowait()
+            queue.put_nowait(event)
+
+    async def _run(self) -> None:
+        manager = await self._manager_factory()
+        while self._subscribers:
+            try:
+                outlet_ids = await manager.get_enabled_outlet_ids()
+                states = await manager.get_status_many(outlet_ids)
+                for outlet_id, state in states.items():
+                    # orjson encodes the state dataclass directly when the event is sent
+                    self._publish({"outlet_id": str(outlet_id), "state": state})
+            except Exception as e:
+                self._logger.error(f"State broadcast round failed: {e}")
+            await asyncio.sleep(self._interval)
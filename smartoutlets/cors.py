@@ -0,0 +1,84 @@
+"""
+SmartOutlet CORS Middleware
+
+This module provides a minimal ASGI CORS middleware for the SmartOutlets service.
+It reproduces what CORSMiddleware does for allow_origins=["*"] with credentials
+(echo the request Origin, allow any method and header) using headers that are
+built once at import instead of per request.
+"""
+
+from typing import List, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+# Methods advertised in preflight responses
+_ALLOW_METHODS = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+
+# Preflight results may be cached by the browser for this many seconds
+_MAX_AGE = b"600"
+
+_PREFLIGHT_HEADERS: List[Tuple[bytes, bytes]] = [
+    (b"access-control-allow-credentials", b"true"),
+    (b"access-control-allow-methods", _ALLOW_METHODS),
+    (b"access-control-max-age", _MAX_AGE),
+    (b"vary", b"Origin"),
+    (b"content-length", b"0"),
+]
+
+_SIMPLE_HEADERS: List[Tuple[bytes, bytes]] = [
+    (b"access-control-allow-credentials", b"true"),
+    (b"vary", b"Origin"),
+]
+
+
+class LeanCORSMiddleware:
+    """
+    Permissive CORS handling in a single ASGI frame.
+
+    Requests without an Origin header pass straight through. Preflight requests
+    are answered directly; all other cross-origin responses get the allow-origin
+    and credentials headers appended on the way out.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        request_headers = None
+        is_preflight = False
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+            elif name == b"access-control-request-method":
+                is_preflight = scope["method"] == "OPTIONS"
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        if is_preflight:
+            headers = [(b"access-control-allow-origin", origin), *_PREFLIGHT_HEADERS]
+            if request_headers is not None:
+                headers.append((b"access-control-allow-headers", request_headers))
+            await send({"type": "http.response.start", "status": 200, "headers": headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"access-control-allow-origin", origin),
+                    *_SIMPLE_HEADERS,
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
@@ -15,6 +15,7 @@ from .drivers.kasa import KasaDriver
 from .drivers.shelly import ShellyDriver
 from .drivers.vesync import VeSyncDriver
 from .exceptions import OutletConnectionError, OutletAuthenticationError, DiscoveryInProgressError, DiscoveryFailedError
+from .schemas import DISCOVERED_LIST_ADAPTER
 
 
 class DiscoveryService:
@@ -107,10 +108,11 @@ class DiscoveryService:
                 # Log error but continue
                 pass
             
-            # Update results
+            # Update results, validated once here so every poll of the results
+            # endpoint can serialize the stored DiscoveredDevice instances as-is
             self._discovery_results[task_id].update({
                 'status': 'completed',
-                'results': results,
+                'results': DISCOVERED_LIST_ADAPTER.validate_python(results),
                 'completed_at': datetime.now()
             })
             
@@ -6,6 +6,7 @@ It provides the interface and retry logic for all driver implementations.
 """
 
 import asyncio
+import functools
 import logging
 from abc import ABC, abstractmethod
 from typing import Dict, Optional, Coroutine, Any, Callable
@@ -14,7 +15,21 @@ from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_excep
 
 from shared.core.config import settings
 from ..exceptions import OutletConnectionError, OutletTimeoutError
-from ..schemas import SmartOutletState
+from ..models import SmartOutletState
+
+
+# Logger for tenacity retry notices; the device ID is included in each message
+_retry_logger = logging.getLogger("AbstractSmartOutletDriver")
+
+
+@functools.lru_cache(maxsize=None)
+def _driver_logger(name: str) -> logging.Logger:
+    """
+    Return the shared logger for a driver class.
+    
+    Cached so creating many drivers doesn't take logging's module lock each time.
+    """
+    return logging.getLogger(name)
 
 
 class AbstractSmartOutletDriver(ABC):
@@ -25,6 +40,8 @@ class AbstractSmartOutletDriver(ABC):
     the required methods for device control and state retrieval.
     """
     
+    __slots__ = ("device_id", "ip_address", "auth_info", "logger")
+    
     def __init__(self, device_id: str, ip_address: str, auth_info: Optional[Dict] = None):
         """
         Initialize the driver.
@@ -37,16 +54,29 @@ class AbstractSmartOutletDriver(ABC):
         self.device_id = device_id
         self.ip_address = ip_address
         self.auth_info = auth_info or {}
-        self.logger = logging.getLogger(f"{self.__class__.__name__}.{device_id}")
+        self.logger = _driver_logger(self.__class__.__name__)
+    
+    async def close(self) -> None:
+        """
+        Release any connections or sessions held by the driver.
+        
+        The base implementation holds nothing; drivers with resources override it.
+        """
+    
+    async def __aenter__(self) -> "AbstractSmartOutletDriver":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
     
     @retry(
         stop=stop_after_attempt(settings.OUTLET_MAX_RETRIES),
         wait=wait_exponential(multiplier=1, min=1, max=10),
         retry=retry_if_exception_type((OutletConnectionError, asyncio.TimeoutError)),
         before_sleep=lambda retry_state: retry_state.outcome.exception() and 
-            logging.getLogger(f"AbstractSmartOutletDriver.{retry_state.args[0].device_id}").warning(
+            _retry_logger.warning(
                 f"Retry attempt {retry_state.attempt_number} for {retry_state.fn.__name__} "
-                f"after {retry_state.outcome.exception()}"
+                f"on device {retry_state.args[0].device_id} after {retry_state.outcome.exception()}"
             )
     )
     async def _perform_network_action(self, action_callable) -> Any:
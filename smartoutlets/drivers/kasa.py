@@ -20,7 +20,7 @@ from kasa.exceptions import (
 )
 
 from .base import AbstractSmartOutletDriver
-from ..schemas import SmartOutletState
+from ..models import SmartOutletState
 from ..exceptions import OutletConnectionError, OutletTimeoutError, OutletAuthenticationError
 
 
@@ -32,12 +32,14 @@ class KasaDriver(AbstractSmartOutletDriver):
     Supports device discovery, control, and state retrieval.
     """
 
+    # Shared by all instances; messages carry the device ID themselves
+    _logger = logging.getLogger("KasaDriver")
+
     def __init__(self, device_id: str, ip_address: str, auth_info: Optional[Dict] = None):
         """
         Initialize the Kasa driver.
         """
         super().__init__(device_id, ip_address, auth_info)
-        self._logger = logging.getLogger(f"KasaDriver.{device_id}")
 
     @classmethod
     async def discover_devices(cls) -> List[Dict[str, Any]]:
@@ -9,7 +9,11 @@ import asyncio
 import logging
 from typing import Dict, Optional, List, Any
 
+import aiohttp
 import aioshelly
+from aioshelly.block_device import COAP, BlockDevice
+from aioshelly.common import ConnectionOptions, get_info
+from aioshelly.rpc_device import RpcDevice, WsServer
 from aioshelly.exceptions import (
     DeviceConnectionError,
     DeviceConnectionTimeoutError,
@@ -19,10 +23,59 @@ from aioshelly.exceptions import (
 )
 
 from .base import AbstractSmartOutletDriver
-from ..schemas import SmartOutletState
+from ..models import SmartOutletState
 from ..exceptions import OutletConnectionError, OutletTimeoutError, OutletAuthenticationError
 
 
+# One HTTP connection pool shared by every Shelly driver, so repeated commands to
+# the same device reuse keep-alive connections instead of reconnecting each time
+_HTTP_SESSION: Optional[aiohttp.ClientSession] = None
+
+# Gen1 devices answer over CoAP; bound lazily to an ephemeral UDP port on first use
+_COAP_CONTEXT: Optional[COAP] = None
+_COAP_LOCK = asyncio.Lock()
+
+# Gen2 devices register for pushed updates here; the listener itself is never started
+_WS_CONTEXT = WsServer()
+
+
+def _get_http_session() -> aiohttp.ClientSession:
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None or _HTTP_SESSION.closed:
+        _HTTP_SESSION = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=4,
+                ttl_dns_cache=300,
+                keepalive_timeout=75
+            )
+        )
+    return _HTTP_SESSION
+
+
+async def _get_coap_context() -> COAP:
+    global _COAP_CONTEXT
+    async with _COAP_LOCK:
+        if _COAP_CONTEXT is None:
+            context = COAP()
+            await context.initialize(socket_port=0)
+            _COAP_CONTEXT = context
+    return _COAP_CONTEXT
+
+
+async def close_shared_sessions() -> None:
+    """
+    Close the HTTP pool and CoAP socket shared by Shelly drivers. Call on service shutdown.
+    """
+    global _HTTP_SESSION, _COAP_CONTEXT
+    if _HTTP_SESSION is not None:
+        await _HTTP_SESSION.close()
+        _HTTP_SESSION = None
+    if _COAP_CONTEXT is not None:
+        _COAP_CONTEXT.close()
+        _COAP_CONTEXT = None
+
+
 class ShellyDriver(AbstractSmartOutletDriver):
     """
     Driver for Shelly Gen1/Gen2 smart outlets.
@@ -31,6 +84,9 @@ class ShellyDriver(AbstractSmartOutletDriver):
     Provides device discovery, control, and state retrieval.
     """
     
+    # Shared by all instances; messages carry the device ID themselves
+    _logger = logging.getLogger("ShellyDriver")
+    
     def __init__(self, device_id: str, ip_address: str, auth_info: Optional[Dict] = None):
         """
         Initialize the Shelly driver.
@@ -41,7 +97,6 @@ class ShellyDriver(AbstractSmartOutletDriver):
             auth_info (Optional[Dict]): Optional authentication information (username/password)
         """
         super().__init__(device_id, ip_address, auth_info)
-        self._logger = logging.getLogger(f"ShellyDriver.{device_id}")
     
     @classmethod
     async def discover_devices(cls) -> List[Dict[str, Any]]:
@@ -89,12 +144,19 @@ class ShellyDriver(AbstractSmartOutletDriver):
         Returns:
             Any: Connected device instance (aioshelly Device for Gen1 or Gen2)
         """
-        device = aioshelly.Device(
+        session = _get_http_session()
+        options = ConnectionOptions(
             self.ip_address,
             username=self.auth_info.get('username'),
             password=self.auth_info.get('password')
         )
         
+        info = await get_info(session, self.ip_address)
+        if info.get('gen', 1) >= 2:
+            device = await RpcDevice.create(session, _WS_CONTEXT, options)
+        else:
+            device = await BlockDevice.create(session, await _get_coap_context(), options)
+        
         await device.initialize()
         return device
     
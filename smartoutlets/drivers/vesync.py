@@ -6,16 +6,270 @@ using the pyvesync library v2.1.18. Includes device discovery, control, and stat
 """
 
 import asyncio
+import functools
 import logging
-from typing import Dict, Optional, List, Any
+import operator
+from itertools import chain
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 
 from pyvesync import VeSync
+import pyvesync.helpers
 import requests
+from requests.adapters import HTTPAdapter
 
 from shared.core.config import settings
 from .base import AbstractSmartOutletDriver
 from ..exceptions import OutletConnectionError, OutletTimeoutError, OutletAuthenticationError
-from ..schemas import SmartOutletState
+from ..models import SmartOutletState
+
+
+# Caps blocking VeSync cloud calls in flight across every driver in the process,
+# keeping bursts under the cloud's rate limit
+_VESYNC_SEMAPHORE = asyncio.Semaphore(settings.VESYNC_MAX_CONCURRENT)
+
+# Energy fields in a _fetch_status result, and the keys they map to
+_ENERGY_FIELDS = ("power", "voltage", "current", "energy", "timestamp")
+_ENERGY_KEYS = ("power_w", "voltage_v", "current_a", "energy_kwh", "timestamp")
+_ENERGY_GETTER = operator.itemgetter(*_ENERGY_FIELDS)
+
+class _PooledHTTP:
+    """
+    Drop-in for the ``requests`` module inside pyvesync that reuses one Session.
+
+    pyvesync calls module-level ``requests.get/post/put``, which opens a new TCP
+    and TLS connection to the VeSync cloud on every call. Routing those calls
+    through a shared Session keeps connections alive across all drivers; the
+    adapter's pool is sized to the outlet executor so worker threads don't queue
+    for a connection.
+    """
+
+    exceptions = requests.exceptions
+
+    def __init__(self, pool_size: int):
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self._session.mount("https://", adapter)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self._session.get(url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self._session.post(url, **kwargs)
+
+    def put(self, url: str, **kwargs) -> requests.Response:
+        return self._session.put(url, **kwargs)
+
+    def close(self) -> None:
+        """
+        Close pooled connections; the Session reconnects if used again.
+        """
+        self._session.close()
+
+
+_HTTP = _PooledHTTP(settings.OUTLET_THREAD_POOL_SIZE)
+pyvesync.helpers.requests = _HTTP
+
+# Seconds an authenticated VeSync manager is reused before logging in again
+MANAGER_TTL_SECONDS = 3600
+
+# Seconds a pooled account's device list is trusted before it is fetched again
+DEVICE_LIST_TTL_SECONDS = 300
+
+
+class _PooledManager:
+    """
+    An authenticated VeSync manager plus a CID index over its devices.
+    """
+
+    __slots__ = ("manager", "logged_in_at", "devices_by_cid", "devices_loaded_at")
+
+    def __init__(self, manager: VeSync, now: float):
+        self.manager = manager
+        self.logged_in_at = now
+        # Device list is fetched lazily on first lookup
+        self.devices_by_cid: Dict[str, Any] = {}
+        self.devices_loaded_at = float("-inf")
+
+    def reindex(self, now: float) -> None:
+        """
+        Rebuild the CID index from the manager's outlet and switch lists.
+        """
+        self.devices_by_cid = {device.cid: device for device in chain(self.manager.outlets, self.manager.switches)}
+        self.devices_loaded_at = now
+
+
+class _ManagerPool:
+    """
+    Process-wide pool of authenticated VeSync managers keyed by (email, password).
+
+    The first caller for an account logs in while holding that account's lock;
+    concurrent callers wait on the lock and reuse the same manager until it is
+    older than the TTL or explicitly invalidated. The account's device list is
+    fetched separately with a single get_devices() call and indexed by CID,
+    refreshed at most once per DEVICE_LIST_TTL_SECONDS.
+    """
+
+    def __init__(self, ttl: float = MANAGER_TTL_SECONDS, device_list_ttl: float = DEVICE_LIST_TTL_SECONDS):
+        self._ttl = ttl
+        self._device_list_ttl = device_list_ttl
+        self._entries: Dict[Tuple[str, str], _PooledManager] = {}
+        self._locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+
+    def _lock_for(self, key: Tuple[str, str]) -> asyncio.Lock:
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks[key] = asyncio.Lock()
+        return lock
+
+    async def get(self, email: str, password: str, time_zone: str) -> VeSync:
+        """
+        Return an authenticated manager for the account, logging in if needed.
+
+        Raises:
+            OutletAuthenticationError: If the VeSync login is rejected
+        """
+        key = (email, password)
+        async with self._lock_for(key):
+            loop = asyncio.get_running_loop()
+            entry = self._entries.get(key)
+            if entry is not None and loop.time() - entry.logged_in_at < self._ttl:
+                return entry.manager
+
+            manager = VeSync(email, password, time_zone=time_zone)
+            async with _VESYNC_SEMAPHORE:
+                login_success = await loop.run_in_executor(None, manager.login)
+            if not login_success:
+                self._entries.pop(key, None)
+                # Use the error message from the library if available, otherwise use a generic message.
+                error_msg = getattr(manager, 'error_msg', 'Invalid credentials or VeSync API error')
+                raise OutletAuthenticationError(f"VeSync login failed for {email}: {error_msg}")
+
+            self._entries[key] = _PooledManager(manager, loop.time())
+            return manager
+
+    async def _load_devices(self, manager: VeSync, entry: Optional[_PooledManager]) -> None:
+        """
+        Fetch the account's device list (one cloud call) and rebuild the index.
+        """
+        loop = asyncio.get_running_loop()
+        async with _VESYNC_SEMAPHORE:
+            await loop.run_in_executor(None, manager.get_devices)
+        if entry is not None:
+            entry.reindex(loop.time())
+
+    async def refresh_devices(self, manager: VeSync) -> None:
+        """
+        Force a fresh device list for a pooled manager, e.g. for explicit discovery.
+        """
+        key = (manager.username, manager.password)
+        async with self._lock_for(key):
+            entry = self._entries.get(key)
+            await self._load_devices(manager, entry if entry is not None and entry.manager is manager else None)
+
+    async def find_device(self, manager: VeSync, cid: str) -> Optional[Any]:
+        """
+        Look up a device on a pooled manager by CID.
+
+        The account's device list is fetched when it is older than the device
+        list TTL, or once when the CID is unknown in case the device was added
+        to the account after the last fetch.
+        """
+        key = (manager.username, manager.password)
+        async with self._lock_for(key):
+            entry = self._entries.get(key)
+            if entry is None or entry.manager is not manager:
+                # Manager was invalidated or replaced; load and search its own lists
+                await self._load_devices(manager, None)
+                return next((d for d in chain(manager.outlets, manager.switches) if d.cid == cid), None)
+
+            fresh = asyncio.get_running_loop().time() - entry.devices_loaded_at < self._device_list_ttl
+            if fresh and cid in entry.devices_by_cid:
+                return entry.devices_by_cid[cid]
+
+            await self._load_devices(manager, entry)
+            return entry.devices_by_cid.get(cid)
+
+    def invalidate(self, email: str, password: str) -> None:
+        """
+        Drop the cached manager for an account so the next caller logs in again.
+        """
+        self._entries.pop((email, password), None)
+
+    def clear(self) -> None:
+        """
+        Drop every pooled manager.
+        """
+        self._entries.clear()
+
+
+_MANAGERS = _ManagerPool()
+
+
+def close_shared_sessions() -> None:
+    """
+    Drop all pooled VeSync logins and close the shared HTTP connections.
+    
+    Intended for service shutdown; drivers used afterwards log in again.
+    """
+    _MANAGERS.clear()
+    _HTTP.close()
+
+
+def get_manager_pool() -> _ManagerPool:
+    """
+    Return the process-wide pool of logged-in VeSync managers.
+    
+    Lets code outside the driver reuse the same logins and CID index.
+    """
+    return _MANAGERS
+
+
+def vesync_call_slot() -> asyncio.Semaphore:
+    """
+    Return the semaphore that caps concurrent VeSync cloud requests.
+    
+    Hold it around every blocking pyvesync call so drivers and services together
+    stay within VESYNC_MAX_CONCURRENT.
+    """
+    return _VESYNC_SEMAPHORE
+
+
+def _vesync_call(action: str) -> Callable:
+    """
+    Map errors raised by a VeSyncDriver coroutine method to outlet exceptions.
+    
+    Authentication failures drop the pooled manager so the next call logs in
+    again; requests errors and anything unexpected are logged and re-raised as
+    OutletTimeoutError / OutletConnectionError.
+    
+    Args:
+        action (str): Description used in messages, e.g. "turning on VeSync outlet"
+    """
+    def decorator(fn: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        @functools.wraps(fn)
+        async def wrapper(self: "VeSyncDriver", *args, **kwargs):
+            try:
+                return await fn(self, *args, **kwargs)
+            except OutletAuthenticationError:
+                _MANAGERS.invalidate(self.auth_info.get('email'), self.auth_info.get('password'))
+                self._manager = self._device = None
+                raise
+            except OutletConnectionError:
+                raise
+            except requests.exceptions.Timeout as e:
+                self._logger.error(f"Timeout {action} {self.device_id} at {self.ip_address}: {e}")
+                raise OutletTimeoutError(f"Timeout {action} at {self.ip_address}: {e}")
+            except requests.exceptions.ConnectionError as e:
+                self._logger.error(f"Connection error {action} {self.device_id} at {self.ip_address}: {e}")
+                raise OutletConnectionError(f"Connection error {action} at {self.ip_address}: {e}")
+            except requests.exceptions.RequestException as e:
+                self._logger.error(f"Request error {action} {self.device_id} at {self.ip_address}: {e}")
+                raise OutletConnectionError(f"Request error {action} at {self.ip_address}: {e}")
+            except Exception as e:
+                self._logger.error(f"Unexpected error {action} {self.device_id} at {self.ip_address}: {e}")
+                raise OutletConnectionError(f"Failed {action} at {self.ip_address}: {e}")
+        return wrapper
+    return decorator
 
 
 class VeSyncDriver(AbstractSmartOutletDriver):
@@ -26,6 +280,11 @@ class VeSyncDriver(AbstractSmartOutletDriver):
     Supports device discovery, control, and state retrieval.
     """
     
+    __slots__ = ("_manager", "_device", "_status_cache", "_lock", "_inflight_status", "_loop")
+    
+    # Shared by all instances; messages carry the device ID themselves
+    _logger = logging.getLogger("VeSyncDriver")
+    
     def __init__(self, device_id: str, ip_address: str, auth_info: Optional[Dict] = None):
         """
         Initialize the VeSync driver.
@@ -36,9 +295,13 @@ class VeSyncDriver(AbstractSmartOutletDriver):
             auth_info (Optional[Dict]): Authentication information containing email, password, and vesync_device_name
         """
         super().__init__(device_id, ip_address, auth_info)
-        self._logger = logging.getLogger(f"VeSyncDriver.{device_id}")
         self._manager = None
         self._device = None
+        self._status_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        # Serializes cloud I/O on this device; concurrent status reads share one fetch
+        self._lock = asyncio.Lock()
+        self._inflight_status: Optional[asyncio.Future] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
     
     @classmethod
     async def discover_devices(cls, email: str, password: str, time_zone: str = "America/New_York") -> List[Dict[str, Any]]:
@@ -47,22 +310,12 @@ class VeSyncDriver(AbstractSmartOutletDriver):
         """
         logger = logging.getLogger("VeSyncDriver.discovery")
         try:
-            loop = asyncio.get_running_loop()
-            manager = VeSync(email, password, time_zone=time_zone)
-
-            # Step 1: Login and explicitly check the boolean result
-            login_success = await loop.run_in_executor(None, manager.login)
-            if not login_success:
-                # Use the error message from the library if available, otherwise use a generic message.
-                error_msg = getattr(manager, 'error_msg', 'Invalid credentials or VeSync API error')
-                raise OutletAuthenticationError(f"VeSync login failed: {error_msg}")
+            manager = await _MANAGERS.get(email, password, time_zone)
 
-            # Step 2: Update devices list and explicitly check the boolean result
-            update_success = await loop.run_in_executor(None, manager.update)
-            if not update_success:
-                raise OutletConnectionError("Failed to update device list from VeSync cloud.")
+            # Discovery always wants a fresh device list; this also refreshes the pool's index
+            await _MANAGERS.refresh_devices(manager)
 
-            # Step 3: Now that updates are successful, safely access the device lists
+            # Now that the account is loaded, safely access the device lists
             discovered_devices = []
 
             # Process outlets
@@ -94,54 +347,112 @@ class VeSyncDriver(AbstractSmartOutletDriver):
         except Exception as e:
             logger.error(f"An unexpected error occurred during VeSync discovery: {e}", exc_info=True)
             raise OutletConnectionError(f"An unexpected error occurred during VeSync discovery: {e}")
+
+    @classmethod
+    async def bulk_turn_on(cls, drivers: List["VeSyncDriver"]) -> List[Union[bool, BaseException]]:
+        """
+        Turn on many VeSync outlets concurrently.
+
+        Args:
+            drivers (List[VeSyncDriver]): Drivers for the outlets to turn on
+
+        Returns:
+            List[Union[bool, BaseException]]: Result or raised exception per driver, in input order
+        """
+        return await cls._bulk_action(drivers, "_turn_on_implementation")
+
+    @classmethod
+    async def bulk_turn_off(cls, drivers: List["VeSyncDriver"]) -> List[Union[bool, BaseException]]:
+        """
+        Turn off many VeSync outlets concurrently.
+
+        Args:
+            drivers (List[VeSyncDriver]): Drivers for the outlets to turn off
+
+        Returns:
+            List[Union[bool, BaseException]]: Result or raised exception per driver, in input order
+        """
+        return await cls._bulk_action(drivers, "_turn_off_implementation")
+
+    @classmethod
+    async def _bulk_action(cls, drivers: List["VeSyncDriver"], method_name: str) -> List[Union[bool, BaseException]]:
+        """
+        Run the named implementation method on every driver in parallel.
+
+        Drivers that share credentials resolve to the same pooled manager, so the
+        account is logged in once instead of once per outlet. Concurrency against
+        the VeSync cloud is capped process-wide by VESYNC_MAX_CONCURRENT.
+        """
+        return await asyncio.gather(
+            *(getattr(driver, method_name)() for driver in drivers), return_exceptions=True
+        )
+
+    async def close(self) -> None:
+        """
+        Release this driver's references to the pooled manager and cached state.
+        
+        The pooled login itself is shared with other drivers on the same account
+        and stays until it expires or close_shared_sessions() is called.
+        """
+        inflight = self._inflight_status
+        if inflight is not None and not inflight.done():
+            inflight.cancel()
+        self._inflight_status = None
+        self._status_cache = None
+        self._device = None
+        self._manager = None
+    
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Return the event loop this driver runs on, looked up once and stored.
+        """
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            loop = self._loop = asyncio.get_running_loop()
+        return loop
+    
+    async def _run_blocking(self, fn: Callable[[], Any]) -> Any:
+        """
+        Run a blocking pyvesync call on the loop's default executor.
+        
+        Calls wait on the process-wide VeSync semaphore first, so at most
+        VESYNC_MAX_CONCURRENT requests reach the cloud at once.
+        """
+        async with _VESYNC_SEMAPHORE:
+            return await self._get_loop().run_in_executor(None, fn)
     
     async def _get_manager(self) -> VeSync:
         """
-        Get or create the VeSync manager instance.
+        Get the shared VeSync manager for this driver's account.
         
         Returns:
             VeSync: Authenticated manager instance
         """
-        if self._manager is None:
-            email = self.auth_info.get('email')
-            password = self.auth_info.get('password')
-            time_zone = self.auth_info.get('time_zone', 'America/New_York')
-            
-            if not email or not password:
-                raise ValueError("VeSync authentication requires email and password")
-            
-            loop = asyncio.get_running_loop()
-            
-            # Create manager instance with timezone
-            self._manager = VeSync(email, password, time_zone=time_zone)
-            
-            # Login and check result
-            login_success = await loop.run_in_executor(None, self._manager.login)
-            if not login_success:
-                raise OutletAuthenticationError(f"VeSync authentication failed for {email}")
-            
-            # Update device list
-            await loop.run_in_executor(None, self._manager.update)
+        email = self.auth_info.get('email')
+        password = self.auth_info.get('password')
+        time_zone = self.auth_info.get('time_zone', 'America/New_York')
+        
+        if not email or not password:
+            raise ValueError("VeSync authentication requires email and password")
         
-        return self._manager
+        manager = await _MANAGERS.get(email, password, time_zone)
+        if manager is not self._manager:
+            # The pool logged in again; device objects from the old manager are stale
+            self._manager = manager
+            self._device = None
+            self._status_cache = None
+        
+        return manager
     
     async def _get_device(self):
         """
         Get the target VeSync device by its CID.
         """
+        manager = await self._get_manager()
         if self._device is None:
-            manager = await self._get_manager()
-
             # The target CID is self.device_id, which was set in the driver's constructor.
             target_cid = self.device_id
-            
-            # Combine outlets and switches from the manager for a comprehensive search.
-            all_devices = manager.outlets + manager.switches
-            
-            for device in all_devices:
-                if device.cid == target_cid:
-                    self._device = device
-                    break
+            self._device = await _MANAGERS.find_device(manager, target_cid)
             
             if not self._device:
                 # This error message is now more informative.
@@ -149,6 +460,15 @@ class VeSyncDriver(AbstractSmartOutletDriver):
         
         return self._device
     
+    @_vesync_call("turning on VeSync outlet")
+    async def _turn_on_action(self) -> bool:
+        device = await self._get_device()
+        async with self._lock:
+            await self._run_blocking(device.turn_on)
+        # Next read must reflect the commanded state
+        self._status_cache = None
+        return True
+    
     async def _turn_on_implementation(self) -> bool:
         """
         Implementation of turn on operation.
@@ -156,26 +476,16 @@ class VeSyncDriver(AbstractSmartOutletDriver):
         Returns:
             bool: True if successful, False otherwise
         """
-        async def _turn_on_action():
-            try:
-                device = await self._get_device()
-                loop = asyncio.get_running_loop()
-                await loop.run_in_executor(None, device.turn_on)
-                return True
-            except requests.exceptions.Timeout as e:
-                self._logger.error(f"Timeout turning on VeSync outlet {self.device_id} at {self.ip_address}: {e}")
-                raise OutletTimeoutError(f"Timeout turning on outlet at {self.ip_address}: {e}")
-            except requests.exceptions.ConnectionError as e:
-                self._logger.error(f"Connection error turning on VeSync outlet {self.device_id} at {self.ip_address}: {e}")
-                raise OutletConnectionError(f"Connection error turning on outlet at {self.ip_address}: {e}")
-            except requests.exceptions.RequestException as e:
-                self._logger.error(f"Request error turning on VeSync outlet {self.device_id} at {self.ip_address}: {e}")
-                raise OutletConnectionError(f"Request error turning on outlet at {self.ip_address}: {e}")
-            except Exception as e:
-                self._logger.error(f"Unexpected error turning on VeSync outlet {self.device_id} at {self.ip_address}: {e}")
-                raise OutletConnectionError(f"Failed to turn on outlet at {self.ip_address}: {e}")
-        
-        return await self._perform_network_action(_turn_on_action)
+        return await self._perform_network_action(self._turn_on_action)
+    
+    @_vesync_call("turning off VeSync outlet")
+    async def _turn_off_action(self) -> bool:
+        device = await self._get_device()
+        async with self._lock:
+            await self._run_blocking(device.turn_off)
+        # Next read must reflect the commanded state
+        self._status_cache = None
+        return True
     
     async def _turn_off_implementation(self) -> bool:
         """
@@ -184,27 +494,9 @@ class VeSyncDriver(AbstractSmartOutletDriver):
         Returns:
             bool: True if successful, False otherwise
         """
-        async def _turn_off_action():
-            try:
-                device = await self._get_device()
-                loop = asyncio.get_running_loop()
-                await loop.run_in_executor(None, device.turn_off)
-                return True
-            except requests.exceptions.Timeout as e:
-                self._logger.error(f"Timeout turning off VeSync outlet {self.device_id} at {self.ip_address}: {e}")
-                raise OutletTimeoutError(f"Timeout turning off outlet at {self.ip_address}: {e}")
-            except requests.exceptions.ConnectionError as e:
-                self._logger.error(f"Connection error turning off VeSync outlet {self.device_id} at {self.ip_address}: {e}")
-                raise OutletConnectionError(f"Connection error turning off outlet at {self.ip_address}: {e}")
-            except requests.exceptions.RequestException as e:
-                self._logger.error(f"Request error turning off VeSync outlet {self.device_id} at {self.ip_address}: {e}")
-                raise OutletConnectionError(f"Request error turning off outlet at {self.ip_address}: {e}")
-            except Exception as e:
-                self._logger.error(f"Unexpected error turning off VeSync outlet {self.device_id} at {self.ip_address}: {e}")
-                raise OutletConnectionError(f"Failed to turn off outlet at {self.ip_address}: {e}")
-        
-        return await self._perform_network_action(_turn_off_action)
+        return await self._perform_network_action(self._turn_off_action)
     
+    @_vesync_call("toggling VeSync outlet")
     async def _toggle_implementation(self) -> bool:
         """
         Implementation of toggle operation.
@@ -212,41 +504,113 @@ class VeSyncDriver(AbstractSmartOutletDriver):
         Returns:
             bool: True if successful, False otherwise
         """
-        current_state = await self._get_state_implementation()
-        if current_state.is_on:
-            return await self._turn_off_implementation()
-        else:
-            return await self._turn_on_implementation()
+        # Served from the state cache when warm, so toggling costs one command
+        status = await self._fetch_status()
+        device = await self._get_device()
+        command = device.turn_off if status['is_on'] else device.turn_on
+        
+        async with self._lock:
+            await self._run_blocking(command)
+        self._status_cache = None
+        return True
     
-    async def _get_state_implementation(self) -> SmartOutletState:
+    async def _fetch_status(self) -> Dict[str, Any]:
         """
-        Implementation of get state operation.
+        Fetch on/off state and energy readings with a single cloud call.
+        
+        The outlet detail call behind device.update() already returns power,
+        voltage and energy alongside the switch state, so one round-trip serves
+        both state and energy reads. The result is reused for
+        VESYNC_STATE_CACHE_TTL_SECONDS to absorb bursts of polling. Callers
+        arriving while a fetch is in flight await that fetch instead of issuing
+        their own; if the caller running it is cancelled (typically by its own
+        timeout), the others fall through and fetch again under their own deadline.
+        
+        Returns:
+            Dict[str, Any]: is_on plus the raw fields named in _ENERGY_FIELDS
         """
-        device = await self._get_device()
-        loop = asyncio.get_running_loop()
+        loop = self._get_loop()
+        while True:
+            cached = self._status_cache
+            if cached is not None and loop.time() - cached[0] < settings.VESYNC_STATE_CACHE_TTL_SECONDS:
+                return cached[1]
 
-        # Update device state from the cloud
-        await loop.run_in_executor(None, device.update)
+            inflight = self._inflight_status
+            if inflight is None:
+                break
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                # Only swallow the owner's cancellation, never one aimed at this caller
+                if not inflight.cancelled() or asyncio.current_task().cancelling():
+                    raise
+
+        inflight = self._inflight_status = loop.create_future()
+        try:
+            async with self._lock:
+                device = await self._get_device()
+                await self._run_blocking(device.update)
 
-        # Get energy meter data if the device supports it
-        energy_data = {}
-        if hasattr(device, 'get_energy_usage'):
-            # get_energy_usage() is a synchronous call in pyvesync
-            # It returns a dictionary with power, voltage, etc.
-            energy_data = await loop.run_in_executor(None, device.get_energy_usage)
+            # Wall switches have no energy fields, so their details are empty
+            details = device.details
+            status = {
+                'is_on': device.is_on,
+                'power': details.get('power'),
+                'voltage': details.get('voltage'),
+                'current': None,  # Not reported by VeSync outlets
+                'energy': details.get('energy'),
+                'timestamp': None,
+            }
+            self._status_cache = (loop.time(), status)
+            inflight.set_result(status)
+            return status
+        except asyncio.CancelledError:
+            inflight.cancel()
+            raise
+        except Exception as e:
+            inflight.set_exception(e)
+            # Mark retrieved so an unawaited future doesn't log; waiters still get it
+            inflight.exception()
+            raise
+        finally:
+            self._inflight_status = None
+    
+    async def _get_state_implementation(self) -> SmartOutletState:
+        """
+        Implementation of get state operation.
+        """
+        status = await self._fetch_status()
 
         # Construct the state object with all available data.
         # If this code is reached without an exception, the device is online.
         return SmartOutletState(
-            is_on=device.is_on,
+            is_on=status['is_on'],
             is_online=True,
-            power_w=energy_data.get('power'),
-            voltage_v=energy_data.get('voltage'),
-            current_a=energy_data.get('current'),
-            energy_kwh=energy_data.get('energy'),
+            power_w=status['power'],
+            voltage_v=status['voltage'],
+            current_a=status['current'],
+            energy_kwh=status['energy'],
             temperature_c=None  # VeSync devices don't typically expose this
         )
     
+    @_vesync_call("discovering VeSync device")
+    async def _discover_action(self) -> Dict:
+        device = await self._get_device()
+        # Update device info
+        async with self._lock:
+            await self._run_blocking(device.update)
+        
+        return {
+            'device_id': self.device_id,
+            'ip_address': self.ip_address,
+            'device_name': device.device_name,
+            'model': device.device_type,
+            'cid': device.cid,
+            'uuid': device.uuid,
+            'is_on': device.is_on,
+            'status': 'connected'
+        }
+    
     async def discover_device(self) -> Dict:
         """
         Discover and return VeSync device information.
@@ -254,38 +618,22 @@ class VeSyncDriver(AbstractSmartOutletDriver):
         Returns:
             Dict: Device information including model, capabilities, etc.
         """
-        async def _discover_action():
-            try:
-                device = await self._get_device()
-                loop = asyncio.get_running_loop()
-                
-                # Update device info
-                await loop.run_in_executor(None, device.update)
-                
-                return {
-                    'device_id': self.device_id,
-                    'ip_address': self.ip_address,
-                    'device_name': device.device_name,
-                    'model': device.device_type,
-                    'cid': device.cid,
-                    'uuid': device.uuid,
-                    'is_on': device.is_on,
-                    'status': 'connected'
-                }
-            except requests.exceptions.Timeout as e:
-                self._logger.error(f"Timeout discovering VeSync device {self.device_id} at {self.ip_address}: {e}")
-                raise OutletTimeoutError(f"Timeout discovering device at {self.ip_address}: {e}")
-            except requests.exceptions.ConnectionError as e:
-                self._logger.error(f"Connection error discovering VeSync device {self.device_id} at {self.ip_address}: {e}")
-                raise OutletConnectionError(f"Connection error discovering device at {self.ip_address}: {e}")
-            except requests.exceptions.RequestException as e:
-                self._logger.error(f"Request error discovering VeSync device {self.device_id} at {self.ip_address}: {e}")
-                raise OutletConnectionError(f"Request error discovering device at {self.ip_address}: {e}")
-            except Exception as e:
-                self._logger.error(f"Unexpected error discovering VeSync device {self.device_id} at {self.ip_address}: {e}")
-                raise OutletConnectionError(f"Failed to discover device at {self.ip_address}: {e}")
+        return await self._perform_network_action(self._discover_action)
+    
+    @_vesync_call("getting energy meter for VeSync outlet")
+    async def _get_energy_action(self) -> Optional[Dict]:
+        # Shares the status fetch (and its short cache) with get_state
+        power_data = await self._fetch_status()
+        
+        # _fetch_status always fills every field, so this is one C-level pull
+        # and a single dict build that drops missing readings
+        energy_data = {k: v for k, v in zip(_ENERGY_KEYS, _ENERGY_GETTER(power_data)) if v is not None}
         
-        return await self._perform_network_action(_discover_action)
+        if not energy_data:
+            # Energy meter not available for this device (e.g. wall switches)
+            self._logger.debug(f"Energy meter not available for {self.device_id} at {self.ip_address}")
+            return None
+        return energy_data
     
     async def get_energy_meter(self) -> Optional[Dict]:
         """
@@ -294,44 +642,4 @@ class VeSyncDriver(AbstractSmartOutletDriver):
         Returns:
             Optional[Dict]: Energy data or None if not available
         """
-        async def _get_energy_action():
-            try:
-                device = await self._get_device()
-                loop = asyncio.get_running_loop()
-                
-                # Get power usage data
-                power_data = await loop.run_in_executor(None, device.get_power_usage)
-                
-                if not power_data:
-                    return None
-                
-                energy_data = {
-                    'power_w': power_data.get('power'),
-                    'voltage_v': power_data.get('voltage'),
-                    'current_a': power_data.get('current'),
-                    'energy_kwh': power_data.get('energy'),
-                    'timestamp': power_data.get('timestamp')
-                }
-                
-                # Filter out None values
-                energy_data = {k: v for k, v in energy_data.items() if v is not None}
-                
-                return energy_data if energy_data else None
-            except AttributeError:
-                # Energy meter not available for this device
-                self._logger.debug(f"Energy meter not available for {self.device_id} at {self.ip_address}")
-                return None
-            except requests.exceptions.Timeout as e:
-                self._logger.error(f"Timeout getting energy meter for VeSync outlet {self.device_id} at {self.ip_address}: {e}")
-                raise OutletTimeoutError(f"Timeout getting energy meter for outlet at {self.ip_address}: {e}")
-            except requests.exceptions.ConnectionError as e:
-                self._logger.error(f"Connection error getting energy meter for VeSync outlet {self.device_id} at {self.ip_address}: {e}")
-                raise OutletConnectionError(f"Connection error getting energy meter for outlet at {self.ip_address}: {e}")
-            except requests.exceptions.RequestException as e:
-                self._logger.error(f"Request error getting energy meter for VeSync outlet {self.device_id} at {self.ip_address}: {e}")
-                raise OutletConnectionError(f"Request error getting energy meter for outlet at {self.ip_address}: {e}")
-            except Exception as e:
-                self._logger.error(f"Unexpected error getting energy meter for VeSync outlet {self.device_id} at {self.ip_address}: {e}")
-                raise OutletConnectionError(f"Failed to get energy meter for outlet at {self.ip_address}: {e}")
-        
-        return await self._perform_network_action(_get_energy_action) 
\ No newline at end of file
+        return await self._perform_network_action(self._get_energy_action)
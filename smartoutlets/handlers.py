@@ -8,7 +8,7 @@ mapping them to appropriate HTTP status codes with consistent response structure
 from typing import Dict, Any
 
 from fastapi import Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 
 from .exceptions import (
@@ -40,57 +40,57 @@ def create_error_response(error: SmartOutletError) -> Dict[str, Any]:
     }
 
 
-async def outlet_not_found_handler(request: Request, exc: OutletNotFoundError) -> JSONResponse:
+async def outlet_not_found_handler(request: Request, exc: OutletNotFoundError) -> ORJSONResponse:
     """Handle OutletNotFoundError - return 404 Not Found."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_404_NOT_FOUND,
         content=create_error_response(exc)
     )
 
 
-async def outlet_connection_handler(request: Request, exc: OutletConnectionError) -> JSONResponse:
+async def outlet_connection_handler(request: Request, exc: OutletConnectionError) -> ORJSONResponse:
     """Handle OutletConnectionError - return 503 Service Unavailable."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
         content=create_error_response(exc)
     )
 
 
-async def outlet_timeout_handler(request: Request, exc: OutletTimeoutError) -> JSONResponse:
+async def outlet_timeout_handler(request: Request, exc: OutletTimeoutError) -> ORJSONResponse:
     """Handle OutletTimeoutError - return 504 Gateway Timeout."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_504_GATEWAY_TIMEOUT,
         content=create_error_response(exc)
     )
 
 
-async def outlet_authentication_handler(request: Request, exc: OutletAuthenticationError) -> JSONResponse:
+async def outlet_authentication_handler(request: Request, exc: OutletAuthenticationError) -> ORJSONResponse:
     """Handle OutletAuthenticationError - return 401 Unauthorized."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_401_UNAUTHORIZED,
         content=create_error_response(exc)
     )
 
 
-async def driver_not_implemented_handler(request: Request, exc: DriverNotImplementedError) -> JSONResponse:
+async def driver_not_implemented_handler(request: Request, exc: DriverNotImplementedError) -> ORJSONResponse:
     """Handle DriverNotImplementedError - return 501 Not Implemented."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_501_NOT_IMPLEMENTED,
         content=create_error_response(exc)
     )
 
 
-async def outlet_disabled_handler(request: Request, exc: OutletDisabledError) -> JSONResponse:
+async def outlet_disabled_handler(request: Request, exc: OutletDisabledError) -> ORJSONResponse:
     """Handle OutletDisabledError - return 409 Conflict."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_409_CONFLICT,
         content=create_error_response(exc)
     )
 
 
-async def generic_smart_outlet_handler(request: Request, exc: SmartOutletError) -> JSONResponse:
+async def generic_smart_outlet_handler(request: Request, exc: SmartOutletError) -> ORJSONResponse:
     """Handle generic SmartOutletError - return 500 Internal Server Error."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content=create_error_response(exc)
     )
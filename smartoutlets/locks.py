@@ -0,0 +1,49 @@
+"""
+SmartOutlet Locking Helpers
+
+This module provides per-key asyncio locks for coordinating concurrent work on
+the same outlet or device without keeping a lock around for every key ever seen.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Hashable, List
+
+
+class KeyedLocks:
+    """
+    Per-key asyncio locks that exist only while some task holds or waits on them.
+
+    A key's lock is created by its first user and dropped when its last user
+    leaves, so the map stays bounded by the work in progress. While any task is
+    holding or waiting, every caller for that key gets the same lock.
+    """
+
+    __slots__ = ("_entries",)
+
+    def __init__(self):
+        # Key -> [lock, number of tasks holding or waiting on it]
+        self._entries: Dict[Hashable, List] = {}
+
+    @asynccontextmanager
+    async def hold(self, key: Hashable) -> AsyncIterator[None]:
+        """
+        Hold the lock for a key for the duration of the ``async with`` block.
+
+        Args:
+            key: Identifies the resource being serialized
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                yield
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0 and self._entries.get(key) is entry:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -11,24 +11,39 @@ This service handles:
 - Driver management for multiple smart outlet brands
 """
 
+import asyncio
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from fastapi import FastAPI, Depends, HTTPException
-from fastapi.middleware.cors import CORSMiddleware
+import orjson
+from fastapi import FastAPI, Depends, HTTPException, Response
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 from sqlalchemy import text
 
 from shared.db.database import engine, Base, async_session
 from shared.utils.logger import get_logger
 from shared.core.config import settings
-from .api import router, vesync_router
+from .api import router, vesync_router, state_broadcaster, get_smart_outlet_manager, close_smart_outlet_manager
+from .drivers.vesync import close_shared_sessions
+from .drivers.shelly import close_shared_sessions as close_shelly_sessions
+from .cors import LeanCORSMiddleware
 from .handlers import register_exception_handlers
 from .manager import SmartOutletManager
 
 logger = get_logger(__name__)
 
+# uvloop ships with uvicorn[standard]. Uvicorn's loop="auto" already selects it, but
+# installing the policy here also covers loops created outside uvicorn. Fall back to
+# the default loop where uvloop is unavailable.
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
 # =============================================================================
 # Application Lifecycle
 # =============================================================================
@@ -42,17 +57,8 @@ async def lifespan(app: FastAPI):
     # Verify database connectivity and table existence
     try:
         async with engine.begin() as conn:
-            # Test database connection
-            await conn.execute(text("SELECT 1"))
-            
-            # Check if smart_outlets table exists
-            result = await conn.execute(text("""
-                SELECT EXISTS (
-                    SELECT FROM information_schema.tables 
-                    WHERE table_schema = 'public' 
-                    AND table_name = 'smart_outlets'
-                )
-            """))
+            # One round-trip both proves connectivity and checks the smart_outlets table exists
+            result = await conn.execute(text("SELECT to_regclass('public.smart_outlets') IS NOT NULL"))
             table_exists = result.scalar()
             
             if not table_exists:
@@ -70,12 +76,34 @@ async def lifespan(app: FastAPI):
             detail=f"Database connection failed: {str(e)}. Please ensure the database is running and initialized."
         )
     
+    # Blocking driver calls (pyvesync) run via run_in_executor(None, ...); size the
+    # default executor for outlet fan-out instead of the small CPython default
+    executor = ThreadPoolExecutor(
+        max_workers=settings.OUTLET_THREAD_POOL_SIZE,
+        thread_name_prefix="outlet-io"
+    )
+    asyncio.get_running_loop().set_default_executor(executor)
+    app.state.executor = executor
+    
+    # Build drivers for enabled outlets now so first requests hit a warm cache
+    try:
+        manager = await get_smart_outlet_manager()
+        warmed = await manager.prewarm()
+        logger.info(f"✅ Prewarmed {warmed} outlet drivers")
+    except Exception as e:
+        logger.warning(f"⚠️ Outlet driver prewarm failed: {e}")
+    
     logger.info("✅ SmartOutlets service started successfully")
     
     yield
     
     # Shutdown
     logger.info("🛑 Shutting down SmartOutlets service...")
+    await state_broadcaster.stop()
+    await close_smart_outlet_manager()
+    close_shared_sessions()
+    await close_shelly_sessions()
+    executor.shutdown(wait=False)
 
 # =============================================================================
 # FastAPI Application
@@ -85,7 +113,8 @@ app = FastAPI(
     title="Bella's Reef - SmartOutlets Service",
     description="Smart outlet management, control, and discovery APIs",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # =============================================================================
@@ -93,13 +122,8 @@ app = FastAPI(
 # =============================================================================
 
 # Use permissive CORS for development - can be made more restrictive in production
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # TODO: Configure specific origins for production
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# TODO: Configure specific origins for production
+app.add_middleware(LeanCORSMiddleware)
 
 # =============================================================================
 # Exception Handlers
@@ -122,36 +146,41 @@ app.include_router(vesync_router, prefix="/api/smartoutlets/vesync/accounts", ta
 # Root Endpoint
 # =============================================================================
 
+# Static payload, serialized once at import
+_ROOT_BYTES = orjson.dumps({
+    "service": "Bella's Reef SmartOutlets Service",
+    "version": "1.0.0",
+    "description": "Smart outlet management, control, and discovery APIs",
+    "endpoints": {
+        "smartoutlets": "/api/smartoutlets"
+    },
+    "features": [
+        "Outlet registration and configuration",
+        "Real-time outlet control",
+        "Device discovery (local and cloud)",
+        "State monitoring and telemetry"
+    ]
+})
+
 @app.get("/")
 async def root():
     """Root endpoint with service information."""
-    return {
-        "service": "Bella's Reef SmartOutlets Service",
-        "version": "1.0.0",
-        "description": "Smart outlet management, control, and discovery APIs",
-        "endpoints": {
-            "smartoutlets": "/api/smartoutlets"
-        },
-        "features": [
-            "Outlet registration and configuration",
-            "Real-time outlet control",
-            "Device discovery (local and cloud)",
-            "State monitoring and telemetry"
-        ]
-    }
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 # =============================================================================
 # Health Check Endpoint
 # =============================================================================
 
+_HEALTH_BYTES = orjson.dumps({
+    "status": "healthy",
+    "service": "smartoutlets",
+    "version": "1.0.0"
+})
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint for the SmartOutlets service."""
-    return {
-        "status": "healthy",
-        "service": "smartoutlets",
-        "version": "1.0.0"
-    }
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
 # =============================================================================
 # Main Entry Point
@@ -165,8 +194,10 @@ if __name__ == "__main__":
         logger.info("SmartOutlets Service is disabled. Set SMART_OUTLETS_ENABLED=true in smartoutlets/.env to enable.")
         sys.exit(0)
     
+    # Import by package path so every "from .exceptions import ..." resolves to
+    # the same module object the exception handlers are registered against
     uvicorn.run(
-        "main:app",
+        "smartoutlets.main:app",
         host=os.getenv("SERVICE_HOST", "0.0.0.0"),
         port=int(os.getenv("SERVICE_PORT", "8000")),
         reload=False,  # Disable reload for production safety
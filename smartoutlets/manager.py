@@ -5,26 +5,88 @@ This module provides the main SmartOutletManager class that handles outlet opera
 with support for multiple driver types (Kasa, Shelly, VeSync).
 """
 
+import asyncio
 import logging
-from typing import Callable, Dict, Type, List, Optional
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from operator import attrgetter
+from uuid import UUID
+from typing import Any, AsyncIterator, Callable, Dict, NamedTuple, Type, List, Optional, Tuple, Union
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import bindparam, select, update
 
 from shared.core.config import settings, is_driver_enabled
 from .drivers import AbstractSmartOutletDriver, KasaDriver, ShellyDriver, VeSyncDriver
+from .driver_types import SmartOutletDriverType
 from .exceptions import DriverNotImplementedError, OutletNotFoundError, OutletConnectionError, OutletDisabledError
 from shared.db.models import SmartOutlet
-from .schemas import SmartOutletState, SmartOutletUpdate, SmartOutletRead
+from .locks import KeyedLocks
+from .models import SmartOutletState
+from .schemas import SmartOutletUpdate, SmartOutletRead
 
 
 # Driver registry mapping driver types to their classes
 DRIVER_REGISTRY: Dict[str, Type[AbstractSmartOutletDriver]] = {
-    "kasa": KasaDriver,
-    "shelly": ShellyDriver,
-    "vesync": VeSyncDriver,
+    SmartOutletDriverType.KASA: KasaDriver,
+    SmartOutletDriverType.SHELLY: ShellyDriver,
+    SmartOutletDriverType.VESYNC: VeSyncDriver,
 }
 
+# Registry entries whose driver type is enabled in config, resolved once at import
+_ACTIVE_DRIVERS: Dict[str, Type[AbstractSmartOutletDriver]] = {
+    driver_type: driver_class
+    for driver_type, driver_class in DRIVER_REGISTRY.items()
+    if is_driver_enabled(driver_type)
+}
+
+
+# Statements built once so every call hits SQLAlchemy's compiled-statement cache
+_STMT_ALL_OUTLETS = select(SmartOutlet)
+_STMT_ENABLED_OUTLETS = _STMT_ALL_OUTLETS.where(SmartOutlet.enabled == True)
+_STMT_OUTLETS_BY_TYPE = _STMT_ALL_OUTLETS.where(SmartOutlet.driver_type == bindparam("driver_type"))
+_STMT_ENABLED_OUTLETS_BY_TYPE = _STMT_ENABLED_OUTLETS.where(SmartOutlet.driver_type == bindparam("driver_type"))
+_STMT_GET_OUTLET = select(SmartOutlet).where(SmartOutlet.id == bindparam("oid"))
+
+# Column-only variants for list endpoints: just the SmartOutletRead columns, no ORM entities
+_STMT_ALL_OUTLET_ROWS = select(*(getattr(SmartOutlet, field) for field in SmartOutletRead.model_fields))
+_STMT_ENABLED_OUTLET_ROWS = _STMT_ALL_OUTLET_ROWS.where(SmartOutlet.enabled == True)
+_STMT_OUTLET_ROWS_BY_TYPE = _STMT_ALL_OUTLET_ROWS.where(SmartOutlet.driver_type == bindparam("driver_type"))
+_STMT_ENABLED_OUTLET_ROWS_BY_TYPE = _STMT_ENABLED_OUTLET_ROWS.where(SmartOutlet.driver_type == bindparam("driver_type"))
+_STMT_ENABLED_OUTLET_IDS = select(SmartOutlet.id).where(SmartOutlet.enabled == True)
+
+# Columns update_outlet may change, with the converter from the schema value (if any)
+_OUTLET_UPDATE_FIELDS: Dict[str, Optional[Callable[[Any], Any]]] = {
+    "nickname": None,
+    "location": None,
+    "role": attrgetter("value"),
+    "enabled": None,
+}
+
+# Seconds outlet rows used to build drivers are trusted without re-reading the database
+OUTLET_META_TTL_SECONDS = 60
+
+# Seconds between background sweeps for idle or expired cached drivers
+DRIVER_HOUSEKEEPING_INTERVAL_SECONDS = 60
+
+
+class _OutletMeta(NamedTuple):
+    """The SmartOutlet columns needed to build a driver, detached from any session."""
+    id: UUID
+    enabled: bool
+    driver_type: str
+    driver_device_id: str
+    ip_address: str
+    auth_info: Optional[Dict]
+
+
+def _outlet_meta(outlet: SmartOutlet) -> _OutletMeta:
+    return _OutletMeta(
+        outlet.id, outlet.enabled, outlet.driver_type,
+        outlet.driver_device_id, outlet.ip_address, outlet.auth_info
+    )
+
 
 class SmartOutletManager:
     """
@@ -43,30 +105,103 @@ class SmartOutletManager:
         """
         self._db_session_factory = db_session_factory
         self._logger = logger
-        self._active_drivers: Dict[str, AbstractSmartOutletDriver] = {}
+        # Least recently used first; capped at SMART_OUTLET_DRIVER_CACHE_SIZE
+        self._active_drivers: "OrderedDict[UUID, AbstractSmartOutletDriver]" = OrderedDict()
+        # Held while a driver is built; an outlet's lock lives only while builds hold or wait on it
+        self._driver_locks = KeyedLocks()
+        # Monotonic creation and last-use times for each cached driver
+        self._driver_created_at: Dict[UUID, float] = {}
+        self._driver_last_used: Dict[UUID, float] = {}
+        self._housekeeper: Optional[asyncio.Task] = None
+        # Recent outlet states and in-flight device reads, so polling bursts share one round trip
+        self._status_cache: Dict[UUID, Tuple[SmartOutletState, float]] = {}
+        self._status_inflight: Dict[UUID, asyncio.Task] = {}
+        self._outlet_meta_cache: Dict[UUID, Tuple[_OutletMeta, float]] = {}
+        # Bumped after every committed outlet update or delete; a database read that
+        # overlaps a bump may predate the change and must not be cached
+        self._outlet_meta_version = 0
         
         # Check if module is enabled
         if not settings.SMART_OUTLETS_ENABLED:
             raise RuntimeError("SmartOutlets module is disabled via config.")
     
+    @asynccontextmanager
+    async def _ro_session(self) -> AsyncIterator[AsyncSession]:
+        """
+        Open a session on an AUTOCOMMIT connection for single-statement reads.
+        
+        Skips the BEGIN/ROLLBACK round trips a transactional session would add.
+        """
+        async with self._db_session_factory() as session:
+            await session.connection(execution_options={"isolation_level": "AUTOCOMMIT"})
+            yield session
+    
     async def get_all_outlets(
         self, include_disabled: bool = False, driver_type: Optional[str] = None
     ) -> List[SmartOutlet]:
         """
         Get all outlets from the database.
         """
-        async with self._db_session_factory() as session:
-            query = select(SmartOutlet)
-            if not include_disabled:
-                query = query.where(SmartOutlet.enabled == True)
-
+        async with self._ro_session() as session:
             if driver_type:
-                query = query.where(SmartOutlet.driver_type == driver_type)
-
-            result = await session.execute(query)
+                query = _STMT_OUTLETS_BY_TYPE if include_disabled else _STMT_ENABLED_OUTLETS_BY_TYPE
+                result = await session.execute(query, {"driver_type": driver_type})
+            else:
+                query = _STMT_ALL_OUTLETS if include_disabled else _STMT_ENABLED_OUTLETS
+                result = await session.execute(query)
             return result.scalars().all()
     
-    async def update_outlet(self, outlet_id: str, update_data: SmartOutletUpdate) -> SmartOutletRead:
+    async def list_outlets_fast(
+        self, include_disabled: bool = False, driver_type: Optional[str] = None
+    ) -> List[SmartOutletRead]:
+        """
+        Get outlets as SmartOutletRead for list responses, without loading ORM entities.
+        
+        Takes the same filters as get_all_outlets. Only the schema's columns are
+        selected, so rows skip identity-map and attribute instrumentation as well
+        as the selectin load of each outlet's VeSync account.
+        """
+        async with self._ro_session() as session:
+            if driver_type:
+                query = _STMT_OUTLET_ROWS_BY_TYPE if include_disabled else _STMT_ENABLED_OUTLET_ROWS_BY_TYPE
+                result = await session.execute(query, {"driver_type": driver_type})
+            else:
+                query = _STMT_ALL_OUTLET_ROWS if include_disabled else _STMT_ENABLED_OUTLET_ROWS
+                result = await session.execute(query)
+            return [SmartOutletRead.from_mapping_fast(row) for row in result.mappings()]
+    
+    async def get_enabled_outlet_ids(self) -> List[UUID]:
+        """
+        Get the IDs of all enabled outlets.
+        
+        For callers that only need IDs: skips fetching and decrypting auth_info
+        and the rest of each row.
+        """
+        async with self._ro_session() as session:
+            result = await session.execute(_STMT_ENABLED_OUTLET_IDS)
+            return result.scalars().all()
+    
+    async def iter_outlets(
+        self, include_disabled: bool = False, driver_type: Optional[str] = None
+    ) -> AsyncIterator[SmartOutlet]:
+        """
+        Yield outlets from the database as rows arrive instead of buffering them all.
+        
+        Takes the same filters as get_all_outlets. Streaming needs a server-side
+        cursor, which asyncpg only allows inside a transaction, so this uses a
+        regular session rather than the AUTOCOMMIT one.
+        """
+        async with self._db_session_factory() as session:
+            if driver_type:
+                query = _STMT_OUTLETS_BY_TYPE if include_disabled else _STMT_ENABLED_OUTLETS_BY_TYPE
+                result = await session.stream_scalars(query, {"driver_type": driver_type})
+            else:
+                query = _STMT_ALL_OUTLETS if include_disabled else _STMT_ENABLED_OUTLETS
+                result = await session.stream_scalars(query)
+            async for outlet in result:
+                yield outlet
+    
+    async def update_outlet(self, outlet_id: UUID, update_data: SmartOutletUpdate) -> SmartOutletRead:
         """
         Update an existing outlet configuration.
         
@@ -80,46 +215,50 @@ class SmartOutletManager:
         Raises:
             OutletNotFoundError: If the outlet is not found
         """
+        changed = {}
+        # Only fields present in the request body; unset fields are never looked at
+        for field in update_data.model_fields_set:
+            value = getattr(update_data, field)
+            if value is not None:
+                to_column = _OUTLET_UPDATE_FIELDS[field]
+                changed[field] = to_column(value) if to_column else value
+        
         async with self._db_session_factory() as session:
-            outlet = await session.get(SmartOutlet, outlet_id)
+            if not changed:
+                outlet = await session.get(SmartOutlet, outlet_id)
+                if not outlet:
+                    raise OutletNotFoundError(f"Outlet with ID {outlet_id} not found")
+                return SmartOutletRead.from_orm_fast(outlet)
+            
+            # Apply and read back the row in a single round trip
+            stmt = (
+                update(SmartOutlet)
+                .where(SmartOutlet.id == outlet_id)
+                .values(**changed)
+                .returning(SmartOutlet)
+                .execution_options(synchronize_session=False)
+            )
+            outlet = (await session.execute(stmt)).scalar_one_or_none()
             
             if not outlet:
                 raise OutletNotFoundError(f"Outlet with ID {outlet_id} not found")
             
-            # Update allowed fields
-            if update_data.nickname is not None:
-                outlet.nickname = update_data.nickname
-                self._logger.info(f"Updated nickname for outlet {outlet_id} to '{update_data.nickname}'")
-            
-            if update_data.location is not None:
-                outlet.location = update_data.location
-                self._logger.info(f"Updated location for outlet {outlet_id} to '{update_data.location}'")
-            
-            if update_data.role is not None:
-                outlet.role = update_data.role.value
-                self._logger.info(f"Updated role for outlet {outlet_id} to '{update_data.role.value}'")
-            
-            if update_data.enabled is not None:
-                old_enabled = outlet.enabled
-                outlet.enabled = update_data.enabled
-                
-                if old_enabled and not update_data.enabled:
-                    # Outlet was disabled, remove from cache
-                    if outlet_id in self._active_drivers:
-                        try:
-                            del self._active_drivers[outlet_id]
-                            self._logger.info(f"Removed disabled outlet {outlet_id} from driver cache")
-                        except Exception as e:
-                            self._logger.warning(f"Failed to remove outlet {outlet_id} from cache: {e}")
-                
-                self._logger.info(f"Updated enabled status for outlet {outlet_id} to {update_data.enabled}")
-            
             await session.commit()
-            await session.refresh(outlet)
+            # Invalidate only after the commit, so no build can re-read the old row
+            self._outlet_meta_version += 1
+            self._outlet_meta_cache.pop(outlet_id, None)
+            
+            if changed.get("enabled") is False and outlet_id in self._active_drivers:
+                # Outlet was disabled, remove from cache
+                await self._evict_driver(outlet_id)
+                self._logger.info(f"Removed disabled outlet {outlet_id} from driver cache")
+            
+            for field, value in changed.items():
+                self._logger.info(f"Updated {field} for outlet {outlet_id} to {value!r}")
             
-            return SmartOutletRead.model_validate(outlet)
+            return SmartOutletRead.from_orm_fast(outlet)
     
-    async def delete_outlet(self, outlet_id: str) -> None:
+    async def delete_outlet(self, outlet_id: UUID) -> None:
         """
         Delete an outlet from the database and unregister it.
         """
@@ -131,14 +270,38 @@ class SmartOutletManager:
             # Delete from database
             await session.delete(outlet)
             await session.commit()
+            self._outlet_meta_version += 1
+            self._outlet_meta_cache.pop(outlet_id, None)
 
             # Unregister from active drivers
-            if outlet_id in self._active_drivers:
-                del self._active_drivers[outlet_id]
+            await self._evict_driver(outlet_id)
 
             self._logger.info(f"Successfully deleted outlet {outlet_id}")
     
-    async def _get_driver_instance(self, outlet_id: str) -> AbstractSmartOutletDriver:
+    async def close(self) -> None:
+        """
+        Stop the housekeeper, then close and forget every cached driver instance.
+        """
+        if self._housekeeper is not None:
+            self._housekeeper.cancel()
+            try:
+                await self._housekeeper
+            except asyncio.CancelledError:
+                pass
+            self._housekeeper = None
+        
+        drivers = list(self._active_drivers.values())
+        self._active_drivers.clear()
+        self._driver_created_at.clear()
+        self._driver_last_used.clear()
+        self._status_cache.clear()
+        for driver in drivers:
+            try:
+                await driver.close()
+            except Exception as e:
+                self._logger.warning(f"Failed to close driver for device {driver.device_id}: {e}")
+    
+    async def _get_driver_instance(self, outlet_id: UUID) -> AbstractSmartOutletDriver:
         """
         Get or create a driver instance for the specified outlet.
         
@@ -152,47 +315,196 @@ class SmartOutletManager:
             OutletNotFoundError: If the outlet is not found in the database
             DriverNotImplementedError: If the driver type is disabled or not supported
         """
-        # Return cached driver if already available
-        if outlet_id in self._active_drivers:
-            return self._active_drivers[outlet_id]
+        # Return cached driver if already available and still fresh
+        driver = self._active_drivers.get(outlet_id)
+        if driver is not None:
+            now = time.monotonic()
+            if self._is_driver_stale(outlet_id, now):
+                await self._evict_driver(outlet_id)
+            else:
+                self._active_drivers.move_to_end(outlet_id)
+                self._driver_last_used[outlet_id] = now
+                return driver
         
-        # Open database session and load outlet
-        async with self._db_session_factory() as session:
-            outlet = await session.get(SmartOutlet, outlet_id)
-            
-            if not outlet:
-                raise OutletNotFoundError(f"Outlet with ID {outlet_id} not found")
+        # Concurrent callers for the same outlet wait here and share one build
+        async with self._driver_locks.hold(outlet_id):
+            driver = self._active_drivers.get(outlet_id)
+            if driver is not None:
+                return driver
+            
+            # Rebuild from recently loaded outlet metadata without touching the database
+            cached = self._outlet_meta_cache.get(outlet_id)
+            if cached is not None and time.monotonic() - cached[1] < OUTLET_META_TTL_SECONDS:
+                meta = cached[0]
+            else:
+                # Load the outlet, reading again if an update committed meanwhile
+                while True:
+                    version = self._outlet_meta_version
+                    async with self._ro_session() as session:
+                        result = await session.execute(_STMT_GET_OUTLET, {"oid": outlet_id})
+                        outlet = result.scalar_one_or_none()
+                        
+                        if not outlet:
+                            raise OutletNotFoundError(f"Outlet with ID {outlet_id} not found")
+                        
+                        meta = _outlet_meta(outlet)
+                    if version == self._outlet_meta_version:
+                        break
+                self._outlet_meta_cache[outlet_id] = (meta, time.monotonic())
+            
+            driver = self._build_driver(meta)
             
-            if not outlet.enabled:
-                self._logger.warning(f"Operation attempted on disabled outlet {outlet_id}")
-                raise OutletDisabledError()
+            # Cache the driver instance
+            await self._cache_driver(outlet_id, driver)
             
-            # Check if driver type is enabled
-            if not is_driver_enabled(outlet.driver_type):
+            return driver
+    
+    async def _cache_driver(self, outlet_id: UUID, driver: AbstractSmartOutletDriver) -> None:
+        """
+        Store a driver as most recently used, closing the oldest ones beyond the cap.
+        """
+        now = time.monotonic()
+        self._active_drivers[outlet_id] = driver
+        self._active_drivers.move_to_end(outlet_id)
+        self._driver_created_at[outlet_id] = now
+        self._driver_last_used[outlet_id] = now
+        while len(self._active_drivers) > settings.SMART_OUTLET_DRIVER_CACHE_SIZE:
+            await self._evict_driver(next(iter(self._active_drivers)))
+        
+        if self._housekeeper is None or self._housekeeper.done():
+            self._housekeeper = asyncio.create_task(self._housekeeping_loop())
+    
+    def _is_driver_stale(self, outlet_id: UUID, now: float) -> bool:
+        """
+        Whether a cached driver has sat idle or lived longer than the configured limits.
+        """
+        return (
+            now - self._driver_last_used.get(outlet_id, now) > settings.SMART_OUTLET_DRIVER_IDLE_TIMEOUT
+            or now - self._driver_created_at.get(outlet_id, now) > settings.SMART_OUTLET_DRIVER_MAX_AGE
+        )
+    
+    async def _evict_driver(self, outlet_id: UUID) -> None:
+        """
+        Remove a driver from the cache and close it; a no-op if it is not cached.
+        """
+        driver = self._active_drivers.pop(outlet_id, None)
+        self._invalidate_status(outlet_id)
+        self._driver_created_at.pop(outlet_id, None)
+        self._driver_last_used.pop(outlet_id, None)
+        if driver is None:
+            return
+        try:
+            await driver.close()
+        except Exception as e:
+            self._logger.warning(f"Failed to close driver for outlet {outlet_id}: {e}")
+    
+    async def _housekeeping_loop(self) -> None:
+        """
+        Periodically close idle or expired drivers so requests don't pay for stale connections.
+        
+        Exits once the cache is empty; the next cached driver starts it again.
+        """
+        while self._active_drivers:
+            await asyncio.sleep(DRIVER_HOUSEKEEPING_INTERVAL_SECONDS)
+            now = time.monotonic()
+            stale = [outlet_id for outlet_id in self._active_drivers if self._is_driver_stale(outlet_id, now)]
+            for outlet_id in stale:
+                await self._evict_driver(outlet_id)
+            if stale:
+                self._logger.info(f"Closed {len(stale)} idle or expired outlet drivers")
+    
+    def _build_driver(self, outlet: Union[SmartOutlet, _OutletMeta]) -> AbstractSmartOutletDriver:
+        """
+        Instantiate the driver for an outlet row after enable/config checks.
+        
+        Raises:
+            OutletDisabledError: If the outlet is disabled
+            DriverNotImplementedError: If the driver type is disabled or not supported
+        """
+        if not outlet.enabled:
+            self._logger.warning(f"Operation attempted on disabled outlet {outlet.id}")
+            raise OutletDisabledError()
+        
+        # Get driver class for an enabled driver type
+        driver_class = _ACTIVE_DRIVERS.get(outlet.driver_type)
+        if not driver_class:
+            if outlet.driver_type in DRIVER_REGISTRY:
                 raise DriverNotImplementedError(
                     f"Driver type '{outlet.driver_type}' is disabled via config"
                 )
-            
-            # Get driver class from registry
-            driver_class = DRIVER_REGISTRY.get(outlet.driver_type)
-            if not driver_class:
-                raise DriverNotImplementedError(
-                    f"Driver type '{outlet.driver_type}' is not supported"
-                )
-            
-            # Instantiate driver with outlet configuration
-            driver = driver_class(
-                device_id=outlet.driver_device_id,
-                ip_address=outlet.ip_address,
-                auth_info=outlet.auth_info
+            raise DriverNotImplementedError(
+                f"Driver type '{outlet.driver_type}' is not supported"
             )
-            
-            # Cache the driver instance
-            self._active_drivers[outlet_id] = driver
-            
-            return driver
+        
+        # Instantiate driver with outlet configuration
+        return driver_class(
+            device_id=outlet.driver_device_id,
+            ip_address=outlet.ip_address,
+            auth_info=outlet.auth_info
+        )
+    
+    async def _prime_drivers(self, outlet_ids: List[UUID]) -> None:
+        """
+        Load and cache drivers for many outlets with a single database query.
+        
+        Outlets that are missing, disabled or unsupported are skipped here; the
+        per-outlet path raises the appropriate error for them afterwards.
+        """
+        missing = []
+        now = time.monotonic()
+        for outlet_id in outlet_ids:
+            if outlet_id in self._active_drivers:
+                continue
+            cached = self._outlet_meta_cache.get(outlet_id)
+            if cached is not None and now - cached[1] < OUTLET_META_TTL_SECONDS:
+                # The per-outlet path rebuilds these from the cached metadata
+                continue
+            missing.append(outlet_id)
+        if not missing:
+            return
+        
+        version = self._outlet_meta_version
+        async with self._ro_session() as session:
+            result = await session.execute(select(SmartOutlet).where(SmartOutlet.id.in_(missing)))
+            outlets = [_outlet_meta(outlet) for outlet in result.scalars()]
+        
+        if version != self._outlet_meta_version:
+            # An update committed during the read; leave these to the per-outlet path
+            return
+        await self._cache_outlets(outlets)
     
-    async def register_outlet_from_db(self, outlet_id: str) -> None:
+    async def prewarm(self) -> int:
+        """
+        Build and cache drivers for every enabled outlet up front.
+        
+        Called at service startup so the first request for each outlet finds its
+        driver already cached instead of paying for the lookup and construction.
+        
+        Returns:
+            int: Number of drivers cached
+        """
+        async for outlet in self.iter_outlets(include_disabled=False):
+            await self._cache_outlets([_outlet_meta(outlet)])
+        return len(self._active_drivers)
+    
+    async def _cache_outlets(self, outlets: List[_OutletMeta]) -> None:
+        """
+        Record metadata for loaded outlets and cache drivers for the usable ones.
+        """
+        now = time.monotonic()
+        for meta in outlets:
+            outlet_id = meta.id
+            self._outlet_meta_cache[outlet_id] = (meta, now)
+            if outlet_id in self._active_drivers:
+                # Built concurrently by the per-outlet path; replacing it would leak its sessions
+                continue
+            try:
+                driver = self._build_driver(meta)
+            except (OutletDisabledError, DriverNotImplementedError):
+                continue
+            await self._cache_driver(outlet_id, driver)
+    
+    async def register_outlet_from_db(self, outlet_id: UUID) -> None:
         """
         Register an outlet from the database with the manager.
         
@@ -206,7 +518,7 @@ class SmartOutletManager:
         # This will validate the outlet exists and create the driver instance
         await self._get_driver_instance(outlet_id)
     
-    async def turn_on_outlet(self, outlet_id: str) -> bool:
+    async def turn_on_outlet(self, outlet_id: UUID) -> bool:
         """
         Turn on a smart outlet.
         
@@ -224,6 +536,7 @@ class SmartOutletManager:
         try:
             driver = await self._get_driver_instance(outlet_id)
             success = await driver.turn_on()
+            self._invalidate_status(outlet_id)
             
             if success:
                 self._logger.info(f"Successfully turned on outlet {outlet_id}")
@@ -237,7 +550,7 @@ class SmartOutletManager:
             self._logger.error(f"Connection error turning on outlet {outlet_id}: {e}")
             raise OutletConnectionError(f"Failed to connect to outlet {outlet_id}: {e}")
     
-    async def turn_off_outlet(self, outlet_id: str) -> bool:
+    async def turn_off_outlet(self, outlet_id: UUID) -> bool:
         """
         Turn off a smart outlet.
         
@@ -255,6 +568,7 @@ class SmartOutletManager:
         try:
             driver = await self._get_driver_instance(outlet_id)
             success = await driver.turn_off()
+            self._invalidate_status(outlet_id)
             
             if success:
                 self._logger.info(f"Successfully turned off outlet {outlet_id}")
@@ -268,7 +582,7 @@ class SmartOutletManager:
             self._logger.error(f"Connection error turning off outlet {outlet_id}: {e}")
             raise OutletConnectionError(f"Failed to connect to outlet {outlet_id}: {e}")
     
-    async def toggle_outlet(self, outlet_id: str) -> bool:
+    async def toggle_outlet(self, outlet_id: UUID) -> bool:
         """
         Toggle a smart outlet (turn off if on, turn on if off).
         
@@ -286,6 +600,7 @@ class SmartOutletManager:
         try:
             driver = await self._get_driver_instance(outlet_id)
             success = await driver.toggle()
+            self._invalidate_status(outlet_id)
             
             if success:
                 self._logger.info(f"Successfully toggled outlet {outlet_id}")
@@ -299,10 +614,80 @@ class SmartOutletManager:
             self._logger.error(f"Connection error toggling outlet {outlet_id}: {e}")
             raise OutletConnectionError(f"Failed to connect to outlet {outlet_id}: {e}")
     
-    async def get_outlet_status(self, outlet_id: str) -> SmartOutletState:
+    async def bulk_apply(self, commands: Dict[UUID, bool]) -> Dict[UUID, Union[bool, BaseException]]:
+        """
+        Turn many outlets on or off concurrently.
+        
+        Args:
+            commands: Mapping of outlet ID to desired state (True = on, False = off)
+            
+        Returns:
+            Dict[UUID, Union[bool, BaseException]]: Per-outlet result, or the exception
+                raised for that outlet, keyed by outlet ID
+        """
+        await self._prime_drivers(list(commands))
+        coros = [
+            self.turn_on_outlet(outlet_id) if turn_on else self.turn_off_outlet(outlet_id)
+            for outlet_id, turn_on in commands.items()
+        ]
+        results = await asyncio.gather(*coros, return_exceptions=True)
+        return dict(zip(commands, results))
+    
+    async def turn_on_many(self, outlet_ids: List[UUID]) -> Dict[UUID, Union[bool, BaseException]]:
+        """
+        Turn on many outlets concurrently.
+        
+        Args:
+            outlet_ids: IDs of the outlets to turn on
+            
+        Returns:
+            Dict[UUID, Union[bool, BaseException]]: Per-outlet result or exception
+        """
+        return await self.bulk_apply(dict.fromkeys(outlet_ids, True))
+    
+    async def turn_off_many(self, outlet_ids: List[UUID]) -> Dict[UUID, Union[bool, BaseException]]:
+        """
+        Turn off many outlets concurrently.
+        
+        Args:
+            outlet_ids: IDs of the outlets to turn off
+            
+        Returns:
+            Dict[UUID, Union[bool, BaseException]]: Per-outlet result or exception
+        """
+        return await self.bulk_apply(dict.fromkeys(outlet_ids, False))
+    
+    async def get_status_many(self, outlet_ids: List[UUID]) -> Dict[UUID, SmartOutletState]:
+        """
+        Get the current status of many outlets concurrently.
+        
+        Drivers are loaded with one database query, then every outlet is read in
+        parallel. An outlet that fails is reported offline instead of failing
+        the whole batch.
+        
+        Args:
+            outlet_ids: IDs of the outlets to read
+            
+        Returns:
+            Dict[UUID, SmartOutletState]: State per outlet ID
+        """
+        await self._prime_drivers(outlet_ids)
+        results = await asyncio.gather(
+            *(self.get_outlet_status(outlet_id) for outlet_id in outlet_ids),
+            return_exceptions=True
+        )
+        return {
+            outlet_id: result if isinstance(result, SmartOutletState) else SmartOutletState(is_on=False, is_online=False)
+            for outlet_id, result in zip(outlet_ids, results)
+        }
+    
+    async def get_outlet_status(self, outlet_id: UUID) -> SmartOutletState:
         """
         Get the current status of a smart outlet.
         
+        States younger than OUTLET_STATUS_CACHE_TTL_SECONDS are served from memory,
+        and concurrent callers for the same outlet share a single device read.
+        
         Args:
             outlet_id: The ID of the outlet to get status for
             
@@ -314,20 +699,46 @@ class SmartOutletManager:
             DriverNotImplementedError: If the driver type is not supported
             OutletConnectionError: If the outlet is unreachable
         """
+        cached = self._status_cache.get(outlet_id)
+        if cached is not None and time.monotonic() - cached[1] < settings.OUTLET_STATUS_CACHE_TTL_SECONDS:
+            return cached[0]
+        
+        task = self._status_inflight.get(outlet_id)
+        if task is None:
+            task = asyncio.ensure_future(self._read_outlet_status(outlet_id))
+            self._status_inflight[outlet_id] = task
+            task.add_done_callback(lambda done: self._finish_status_read(outlet_id, done))
+        
+        # Shield so one cancelled caller doesn't cancel the read for the others
+        return await asyncio.shield(task)
+    
+    def _finish_status_read(self, outlet_id: UUID, task: asyncio.Task) -> None:
+        succeeded = not task.cancelled() and task.exception() is None
+        if self._status_inflight.get(outlet_id) is not task:
+            # Detached by _invalidate_status: the reading may predate a command or update
+            return
+        del self._status_inflight[outlet_id]
+        if succeeded:
+            self._status_cache[outlet_id] = (task.result(), time.monotonic())
+    
+    def _invalidate_status(self, outlet_id: UUID) -> None:
+        """
+        Forget an outlet's cached state and detach any read already in flight.
+        
+        A detached read still answers the callers awaiting it, but its result is
+        not cached, so the next call reads the device again.
+        """
+        self._status_cache.pop(outlet_id, None)
+        self._status_inflight.pop(outlet_id, None)
+    
+    async def _read_outlet_status(self, outlet_id: UUID) -> SmartOutletState:
+        """
+        Read the state of an outlet from its device, bypassing the status cache.
+        """
         try:
             driver = await self._get_driver_instance(outlet_id)
-            raw_state = await driver.get_state()
-            
-            # Convert dataclass to Pydantic schema
-            state = SmartOutletState(
-                is_on=raw_state.is_on,
-                power_w=raw_state.power_w,
-                voltage_v=raw_state.voltage_v,
-                current_a=raw_state.current_a,
-                energy_kwh=raw_state.energy_kwh,
-                temperature_c=raw_state.temperature_c,
-                is_online=True  # If we got a response, the outlet is online
-            )
+            # Kept as the driver's dataclass; the API converts it to the schema at the boundary
+            state = await driver.get_state()
             
             self._logger.debug(f"Retrieved state for outlet {outlet_id}: {state}")
             return state
@@ -0,0 +1,35 @@
+"""
+SmartOutlet Internal Models
+
+This module defines lightweight internal data structures produced by the drivers.
+They are converted to the Pydantic schemas in schemas.py only at the API boundary.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(slots=True, frozen=True)
+class SmartOutletState:
+    """
+    A single state reading from an outlet driver.
+
+    Slotted and immutable: the poller creates one per outlet per round, and
+    cached readings are shared between callers, so they must not be mutated.
+
+    Attributes:
+        is_on (bool): Whether the outlet is currently on
+        is_online (bool): Whether the outlet responded to the read
+        power_w (Optional[float]): Current power consumption in watts
+        voltage_v (Optional[float]): Current voltage in volts
+        current_a (Optional[float]): Current amperage in amps
+        energy_kwh (Optional[float]): Total energy consumption in kWh
+        temperature_c (Optional[float]): Device temperature in Celsius
+    """
+    is_on: bool
+    is_online: bool
+    power_w: Optional[float] = None
+    voltage_v: Optional[float] = None
+    current_a: Optional[float] = None
+    energy_kwh: Optional[float] = None
+    temperature_c: Optional[float] = None
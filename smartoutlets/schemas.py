@@ -7,17 +7,57 @@ This module defines Pydantic models for SmartOutlet data validation and serializ
 including creation, update, state, and discovery schemas.
 """
 
-from typing import Optional, Dict, Any, List
+import functools
+import ipaddress
+import sys
+from typing import Optional, Any, List, Literal, Mapping
 from uuid import UUID
 from datetime import datetime
 from enum import Enum
 
-from pydantic import BaseModel, Field, constr, EmailStr, SecretStr, field_validator, ConfigDict
+from pydantic import BaseModel, Field, EmailStr, SecretStr, field_validator, ConfigDict, TypeAdapter, ValidationInfo
+from typing_extensions import TypedDict
 import pytz
 from .driver_types import SmartOutletDriverType
 from shared.schemas import DeviceRole
 
 
+# Literal aliases for read-side schemas: values come from the DB and only need a
+# set-membership check, not enum coercion. Create keeps the Enums for clearer errors.
+DriverTypeLiteral = Literal[tuple(member.value for member in SmartOutletDriverType)]
+DeviceRoleLiteral = Literal[tuple(member.value for member in DeviceRole)]
+
+
+@functools.lru_cache(maxsize=1024)
+def _check_ip_address(value: str) -> str:
+    """
+    Return value if it is a valid IPv4 or IPv6 address.
+
+    Cached per string, since the same few device addresses are submitted repeatedly.
+
+    Raises:
+        ValueError: If value is not an IP address
+    """
+    ipaddress.ip_address(value)
+    return value
+
+
+class OutletAuthInfo(TypedDict, total=False):
+    """
+    Driver credentials stored (encrypted) in SmartOutlet.auth_info.
+
+    Shelly uses username/password; VeSync uses email/password/time_zone; Kasa
+    needs none. Every key is optional and may be null (an open Shelly sends a
+    null password). Unknown keys are kept as-is.
+    """
+    __pydantic_config__ = ConfigDict(extra='allow')
+
+    username: Optional[str]
+    password: Optional[str]
+    email: Optional[str]
+    time_zone: Optional[str]
+
+
 class SmartOutletCreate(BaseModel):
     """
     Schema for creating a new smart outlet.
@@ -28,7 +68,7 @@ class SmartOutletCreate(BaseModel):
         name (str): Human-readable name for the outlet
         nickname (Optional[str]): Optional nickname
         ip_address (str): IP address of the device
-        auth_info (Optional[Dict[str, Any]]): Authentication information
+        auth_info (Optional[OutletAuthInfo]): Authentication information
         location (Optional[str]): Physical location of the outlet
         role (DeviceRole): Role of the outlet
         enabled (bool): Whether the outlet is enabled
@@ -41,13 +81,22 @@ class SmartOutletCreate(BaseModel):
     name: str = Field(..., description="Human-readable name for the outlet")
     nickname: Optional[str] = Field(None, description="Optional nickname")
     ip_address: str = Field(..., description="IP address of the device")
-    auth_info: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Authentication information")
+    auth_info: Optional[OutletAuthInfo] = Field(default_factory=dict, description="Authentication information")
     location: Optional[str] = Field(None, description="Physical location of the outlet")
     role: DeviceRole = Field(default=DeviceRole.GENERAL, description="Role of the outlet")
     enabled: bool = Field(default=True, description="Whether the outlet is enabled")
     poller_enabled: bool = Field(default=True, description="Whether polling is enabled")
     scheduler_enabled: bool = Field(default=True, description="Whether scheduling is enabled")
 
+    model_config = ConfigDict(defer_build=True)
+
+    @field_validator('ip_address')
+    def validate_ip_address(cls, v, info: ValidationInfo):
+        # Cloud devices have no local address to check
+        if info.data.get('driver_type') == SmartOutletDriverType.VESYNC:
+            return v
+        return _check_ip_address(v)
+
 
 class SmartOutletRead(BaseModel):
     """
@@ -55,14 +104,14 @@ class SmartOutletRead(BaseModel):
 
     Attributes:
         id (UUID): Unique identifier
-        driver_type (str): Type of smart outlet driver
+        driver_type (DriverTypeLiteral): Type of smart outlet driver
         driver_device_id (str): Device ID from the driver
         name (str): Human-readable name for the outlet
         nickname (Optional[str]): Optional nickname
         ip_address (str): IP address of the device
-        auth_info (Optional[Dict[str, Any]]): Authentication information
+        auth_info (Optional[OutletAuthInfo]): Authentication information
         location (Optional[str]): Physical location of the outlet
-        role (str): Role of the outlet
+        role (DeviceRoleLiteral): Role of the outlet
         enabled (bool): Whether the outlet is enabled
         poller_enabled (bool): Whether polling is enabled
         scheduler_enabled (bool): Whether scheduling is enabled
@@ -71,29 +120,60 @@ class SmartOutletRead(BaseModel):
         updated_at (datetime): Last update timestamp
     """
     
-    id: UUID = Field(..., description="Unique identifier")
-    driver_type: str = Field(..., description="Type of smart outlet driver")
-    driver_device_id: str = Field(..., description="Device ID from the driver")
-    name: str = Field(..., description="Human-readable name for the outlet")
-    nickname: Optional[str] = Field(None, description="Optional nickname")
-    ip_address: str = Field(..., description="IP address of the device")
-    auth_info: Optional[Dict[str, Any]] = Field(None, description="Authentication information")
-    location: Optional[str] = Field(None, description="Physical location of the outlet")
-    role: str = Field(..., description="Role of the outlet")
-    enabled: bool = Field(..., description="Whether the outlet is enabled")
-    poller_enabled: bool = Field(..., description="Whether polling is enabled")
-    scheduler_enabled: bool = Field(..., description="Whether scheduling is enabled")
-    is_online: Optional[bool] = Field(None, description="Whether the outlet is currently online (None if not checked)")
-    created_at: datetime = Field(..., description="Creation timestamp")
-    updated_at: datetime = Field(..., description="Last update timestamp")
+    id: UUID
+    driver_type: DriverTypeLiteral
+    driver_device_id: str
+    name: str
+    nickname: Optional[str] = None
+    ip_address: str
+    auth_info: Optional[OutletAuthInfo] = None
+    location: Optional[str] = None
+    role: DeviceRoleLiteral
+    enabled: bool
+    poller_enabled: bool
+    scheduler_enabled: bool
+    is_online: Optional[bool] = None
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
+
+    @classmethod
+    def from_orm_fast(cls, obj: Any) -> "SmartOutletRead":
+        """
+        Build from a SmartOutlet row without validation.
+
+        Rows coming out of the database already satisfy this schema, so use this
+        on output paths; request bodies still go through model_validate.
+        """
+        return cls.from_mapping_fast({field: getattr(obj, field) for field in _READ_FIELDS})
+
+    @classmethod
+    def from_mapping_fast(cls, values: Mapping[str, Any]) -> "SmartOutletRead":
+        """
+        Build from a column mapping (e.g. a Core result row) without validation.
 
-    model_config = ConfigDict(from_attributes=True)
+        driver_type and role come from a handful of values, so they are interned
+        and every row in a large listing shares the same string objects.
+        """
+        return cls.model_construct(**{
+            **values,
+            "driver_type": sys.intern(values["driver_type"]),
+            "role": sys.intern(values["role"]),
+        })
+
+
+# SmartOutletRead fields, read straight off ORM rows by from_orm_fast
+_READ_FIELDS = tuple(SmartOutletRead.model_fields)
 
 
 class SmartOutletUpdate(BaseModel):
     """
     Schema for updating smart outlet data.
 
+    Consumers should iterate model_fields_set to read only the fields the client
+    sent, rather than dumping the whole model with exclude_unset=True.
+
     Attributes:
         nickname (Optional[str]): Optional nickname
         location (Optional[str]): Physical location of the outlet
@@ -106,6 +186,8 @@ class SmartOutletUpdate(BaseModel):
     role: Optional[DeviceRole] = Field(None, description="Role of the outlet")
     enabled: Optional[bool] = Field(None, description="Whether the outlet is enabled")
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class SmartOutletState(BaseModel):
     """
@@ -121,13 +203,25 @@ class SmartOutletState(BaseModel):
         is_online (bool): Whether the outlet is currently online
     """
     
-    is_on: bool = Field(..., description="Whether the outlet is currently on")
-    power_w: Optional[float] = Field(None, description="Current power consumption in watts")
-    voltage_v: Optional[float] = Field(None, description="Current voltage in volts")
-    current_a: Optional[float] = Field(None, description="Current amperage in amps")
-    energy_kwh: Optional[float] = Field(None, description="Total energy consumption in kWh")
-    temperature_c: Optional[float] = Field(None, description="Device temperature in Celsius")
-    is_online: bool = Field(..., description="Whether the outlet is currently online")
+    is_on: bool
+    power_w: Optional[float] = None
+    voltage_v: Optional[float] = None
+    current_a: Optional[float] = None
+    energy_kwh: Optional[float] = None
+    temperature_c: Optional[float] = None
+    is_online: bool
+
+    model_config = ConfigDict(defer_build=True)
+
+    @classmethod
+    def from_dataclass(cls, state: Any) -> "SmartOutletState":
+        """
+        Build from a driver's models.SmartOutletState at the HTTP boundary.
+
+        Validated rather than constructed: drivers pass device readings through
+        as reported, so this is where e.g. a string power reading becomes a float.
+        """
+        return cls.model_validate(state, from_attributes=True)
 
 
 # Discovery Schemas
@@ -146,6 +240,8 @@ class VeSyncDiscoveryRequest(BaseModel):
     password: SecretStr = Field(..., description="VeSync account password")
     time_zone: str = Field(..., description="IANA timezone for VeSync API communications")
 
+    model_config = ConfigDict(defer_build=True)
+
     @field_validator('time_zone')
     def validate_timezone(cls, v):
         if v not in pytz.all_timezones:
@@ -164,10 +260,12 @@ class DiscoveredDevice(BaseModel):
         name (str): Device name
     """
     
-    driver_type: str = Field(..., description="Type of smart outlet driver")
-    driver_device_id: str = Field(..., description="Device ID from the driver")
-    ip_address: Optional[str] = Field(None, description="IP address of the device (not required for cloud devices)")
-    name: str = Field(..., description="Device name")
+    driver_type: str
+    driver_device_id: str
+    ip_address: Optional[str] = None
+    name: str
+
+    model_config = ConfigDict(defer_build=True)
 
 
 class DiscoveryTaskResponse(BaseModel):
@@ -180,6 +278,8 @@ class DiscoveryTaskResponse(BaseModel):
     
     task_id: str = Field(..., description="Task ID for tracking the discovery process")
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class DiscoveryResults(BaseModel):
     """
@@ -194,12 +294,15 @@ class DiscoveryResults(BaseModel):
         error (Optional[str]): Error message if task failed
     """
     
-    task_id: str = Field(..., description="Task ID")
-    status: str = Field(..., description="Task status: running, completed, or failed")
-    created_at: datetime = Field(..., description="Task creation timestamp")
-    completed_at: Optional[datetime] = Field(None, description="Task completion timestamp")
-    results: List[DiscoveredDevice] = Field(default_factory=list, description="List of discovered devices")
-    error: Optional[str] = Field(None, description="Error message if task failed")
+    task_id: str
+    status: str
+    created_at: datetime
+    completed_at: Optional[datetime] = None
+    results: List[DiscoveredDevice] = Field(default_factory=list)
+    error: Optional[str] = None
+
+    # Stored DiscoveredDevice instances are embedded as-is, never copied or revalidated
+    model_config = ConfigDict(defer_build=True, revalidate_instances='never')
 
 
 # VeSync Account Schemas
@@ -215,6 +318,8 @@ class VeSyncAccountBase(BaseModel):
     email: EmailStr
     time_zone: str = Field(..., description="IANA timezone for VeSync API communications")
 
+    model_config = ConfigDict(defer_build=True)
+
     @field_validator('time_zone')
     def validate_timezone(cls, v):
         if v not in pytz.all_timezones:
@@ -251,6 +356,8 @@ class VeSyncAccountUpdate(BaseModel):
     is_active: Optional[bool] = None
     time_zone: Optional[str] = Field(None, description="IANA timezone for VeSync API communications")
 
+    model_config = ConfigDict(defer_build=True)
+
     @field_validator('time_zone')
     def validate_timezone(cls, v):
         if v is not None and v not in pytz.all_timezones:
@@ -258,25 +365,31 @@ class VeSyncAccountUpdate(BaseModel):
         return v
 
 
-class VeSyncAccountRead(VeSyncAccountBase):
+class VeSyncAccountRead(BaseModel):
     """
     Schema for reading VeSync account data.
 
+    Deliberately not a VeSyncAccountBase: stored emails and time zones were
+    checked on the way in, so rows skip email-validator and the time zone lookup.
+
     Attributes:
+        email (str): VeSync account email address
+        time_zone (str): IANA timezone for VeSync API communications
         id (int): Unique identifier
-        email (EmailStr): VeSync account email address
         is_active (bool): Whether the account is active
         last_sync_status (str): Last synchronization status
         last_synced_at (Optional[datetime]): Last synchronization timestamp
         created_at (datetime): Creation timestamp
     """
+    email: str
+    time_zone: str
     id: int
     is_active: bool
     last_sync_status: str
     last_synced_at: Optional[datetime] = None
     created_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 # VeSync Device Management Schemas
@@ -302,6 +415,8 @@ class DiscoveredVeSyncDevice(BaseModel):
     is_on: bool = Field(..., description="Current power state")
     power_w: Optional[float] = Field(None, description="Current power consumption in watts")
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class VeSyncDeviceCreate(BaseModel):
     """
@@ -320,6 +435,8 @@ class VeSyncDeviceCreate(BaseModel):
     location: Optional[str] = Field(None, description="Physical location")
     role: DeviceRole = Field(default=DeviceRole.GENERAL, description="Role of the outlet")
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class SmartOutletWithState(SmartOutletRead):
     """
@@ -333,4 +450,9 @@ class SmartOutletWithState(SmartOutletRead):
     current_a: Optional[float] = Field(None, description="Current amperage in amps")
     energy_kwh: Optional[float] = Field(None, description="Total energy consumption in kWh")
     temperature_c: Optional[float] = Field(None, description="Device temperature in Celsius")
-    is_online: bool = Field(..., description="Whether device is currently online") 
\ No newline at end of file
+    is_online: bool = Field(..., description="Whether device is currently online") 
+
+
+# List validators/serializers built once at import rather than per request
+READ_LIST_ADAPTER = TypeAdapter(List[SmartOutletRead])
+DISCOVERED_LIST_ADAPTER = TypeAdapter(List[DiscoveredDevice])
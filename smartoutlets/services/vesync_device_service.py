@@ -6,20 +6,29 @@ including discovery, state management, and control operations.
 """
 
 import asyncio
-from typing import List, Optional, Dict, Any
+import time
+from collections import OrderedDict
+from itertools import chain
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from pyvesync import VeSync
 from datetime import datetime
 import pytz
 
+from shared.core.config import settings
 from shared.utils.logger import get_logger
 from shared.db.models import VeSyncAccount, SmartOutlet
 from ..exceptions import OutletAuthenticationError, OutletConnectionError
 from ..schemas import DiscoveredVeSyncDevice, SmartOutletWithState
 from ..crypto_utils import decrypt_vesync_password
+from ..drivers.vesync import get_manager_pool, vesync_call_slot
+from ..locks import KeyedLocks
 
 
 logger = get_logger(__name__)
 
+# Accounts whose decrypted password is kept in memory, least recently used evicted first
+PASSWORD_CACHE_SIZE = 16
+
 
 class VeSyncDeviceService:
     """
@@ -31,11 +40,22 @@ class VeSyncDeviceService:
     
     def __init__(self):
         """Initialize the VeSync device service."""
-        pass
+        # Last state per (account ID, device CID) with its monotonic read time; the
+        # lock per key makes concurrent readers share one cloud round trip
+        self._state_cache: Dict[Tuple[int, str], Tuple[float, Dict[str, Any]]] = {}
+        self._state_locks = KeyedLocks()
+        # Bumped by every command; a read that overlapped one is not cached
+        self._state_version = 0
+        # Decrypted password per account ID, stored with the ciphertext it came from
+        # so a changed password is decrypted again
+        self._passwords: "OrderedDict[int, Tuple[bytes, str]]" = OrderedDict()
     
     async def _get_manager(self, account: VeSyncAccount) -> VeSync:
         """
-        Get or create a VeSync manager for the account.
+        Get an authenticated VeSync manager for the account.
+        
+        Managers come from the VeSync driver's process-wide pool, so the service
+        and the drivers share one login and one CID index per account.
         
         Args:
             account: VeSync account with encrypted credentials
@@ -46,30 +66,77 @@ class VeSyncDeviceService:
         Raises:
             OutletAuthenticationError: If credentials are invalid
         """
-        # Decrypt password
+        password = self._get_password(account)
+        return await get_manager_pool().get(account.email, password, account.time_zone)
+    
+    def _get_password(self, account: VeSyncAccount) -> str:
+        """
+        Return the account's decrypted password, decrypting only on a cache miss.
+        
+        Raises:
+            OutletAuthenticationError: If the account has no stored password or it cannot be decrypted
+        """
+        if not account.password_encrypted:
+            raise OutletAuthenticationError(f"Missing credentials for account {account.email}")
+        
+        cached = self._passwords.get(account.id)
+        if cached is not None and cached[0] == account.password_encrypted:
+            self._passwords.move_to_end(account.id)
+            return cached[1]
+        
         password = decrypt_vesync_password(account.password_encrypted.decode())
         if not password:
             raise OutletAuthenticationError(f"Could not decrypt password for account {account.email}")
         
-        # Create manager with stored timezone
-        manager = VeSync(account.email, password, time_zone=account.time_zone)
+        self._passwords[account.id] = (account.password_encrypted, password)
+        self._passwords.move_to_end(account.id)
+        if len(self._passwords) > PASSWORD_CACHE_SIZE:
+            # Drop the plaintext reference eagerly rather than waiting for reuse
+            self._passwords.popitem(last=False)
+        return password
+    
+    async def _find_device(self, manager: VeSync, vesync_device_id: str) -> Any:
+        """
+        Look up an outlet or switch by CID through the pooled manager's index.
         
-        # Login
-        login_success = await asyncio.to_thread(manager.login)
-        if not login_success:
-            # The 'error_msg' attribute is not reliable across pyvesync versions.
-            # We will raise a clear, generic authentication error if login returns false.
-            raise OutletAuthenticationError(f"VeSync login failed for {account.email}. Please check your credentials.")
+        Raises:
+            OutletConnectionError: If the account has no device with that CID
+        """
+        device = await get_manager_pool().find_device(manager, vesync_device_id)
+        if device is None:
+            raise OutletConnectionError(f"Device {vesync_device_id} not found in VeSync account")
+        return device
+    
+    async def _cloud_call(self, fn: Callable[[], Any]) -> Any:
+        """
+        Run a blocking pyvesync call in a worker thread.
         
-        return manager
+        Calls share the VeSync driver's process-wide semaphore, so the service and
+        the drivers together keep at most VESYNC_MAX_CONCURRENT requests in flight
+        to the cloud. pyvesync's HTTP calls already go through the driver's pooled
+        keep-alive session.
+        """
+        async with vesync_call_slot():
+            return await asyncio.to_thread(fn)
     
-    async def discover_devices(self, account: VeSyncAccount) -> List[DiscoveredVeSyncDevice]:
+    async def discover_devices(self, account: VeSyncAccount, refresh: bool = True) -> List[DiscoveredVeSyncDevice]:
         """
         Discover all devices available for the VeSync account.
+        
+        Args:
+            account: VeSync account
+            refresh: Also fetch each device's current details (power state and
+                usage). The per-device calls run concurrently; pass False when
+                only the device list is needed.
         """
         try:
             manager = await self._get_manager(account)
-            await asyncio.to_thread(manager.update)
+            await get_manager_pool().refresh_devices(manager)
+            if refresh:
+                await asyncio.gather(
+                    *(self._cloud_call(device.update) for device in chain(manager.outlets, manager.switches)),
+                    return_exceptions=True
+                )
     
             processed_devices = []
     
@@ -116,21 +183,43 @@ class VeSyncDeviceService:
     async def get_device_state(self, account: VeSyncAccount, vesync_device_id: str) -> Dict[str, Any]:
         """
         Get the current state of a specific device, safely parsing nested data.
+        
+        States younger than VESYNC_DEVICE_STATE_TTL_SECONDS are served from memory
+        to stay clear of the VeSync cloud's rate limits.
+        """
+        key = (account.id, vesync_device_id)
+        cached = self._state_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < settings.VESYNC_DEVICE_STATE_TTL_SECONDS:
+            return dict(cached[1])
+        
+        async with self._state_locks.hold(key):
+            # Another caller may have refreshed the state while this one waited
+            cached = self._state_cache.get(key)
+            if cached is not None and time.monotonic() - cached[0] < settings.VESYNC_DEVICE_STATE_TTL_SECONDS:
+                return dict(cached[1])
+            
+            version = self._state_version
+            state = await self._read_device_state(account, vesync_device_id)
+            if version == self._state_version:
+                self._state_cache[key] = (time.monotonic(), state)
+            return dict(state)
+    
+    def _invalidate_state(self, account: VeSyncAccount, vesync_device_id: str) -> None:
+        """
+        Drop a device's cached state after a command and keep reads already in flight from restoring it.
+        """
+        self._state_version += 1
+        self._state_cache.pop((account.id, vesync_device_id), None)
+    
+    async def _read_device_state(self, account: VeSyncAccount, vesync_device_id: str) -> Dict[str, Any]:
+        """
+        Read a device's state from the VeSync cloud, bypassing the state cache.
         """
         try:
             manager = await self._get_manager(account)
-            await asyncio.to_thread(manager.update)
-
-            # Combine outlets and switches for easier searching
-            all_devices = manager.outlets + manager.switches
-            target_device = None
-            for device in all_devices:
-                if device.cid == vesync_device_id:
-                    target_device = device
-                    break
-
-            if not target_device:
-                raise OutletConnectionError(f"Device {vesync_device_id} not found in VeSync account")
+            target_device = await self._find_device(manager, vesync_device_id)
+            # Refresh just this device rather than every device on the account
+            await self._cloud_call(target_device.update)
 
             # Safely extract all attributes using getattr, providing default values
             is_on = getattr(target_device, 'is_on', False)
@@ -177,27 +266,13 @@ class VeSyncDeviceService:
         """
         try:
             manager = await self._get_manager(account)
-            await asyncio.to_thread(manager.update)
+            device = await self._find_device(manager, vesync_device_id)
             
-            # Find and control device in outlets
-            if hasattr(manager, 'outlets') and manager.outlets:
-                for outlet in manager.outlets:
-                    if outlet.cid == vesync_device_id:
-                        success = await asyncio.to_thread(outlet.turn_on)
-                        if not success:
-                            raise OutletConnectionError(f"Failed to turn on device {vesync_device_id}")
-                        return True
-            
-            # Find and control device in switches
-            if hasattr(manager, 'switches') and manager.switches:
-                for switch in manager.switches:
-                    if switch.cid == vesync_device_id:
-                        success = await asyncio.to_thread(switch.turn_on)
-                        if not success:
-                            raise OutletConnectionError(f"Failed to turn on device {vesync_device_id}")
-                        return True
-            
-            raise OutletConnectionError(f"Device {vesync_device_id} not found")
+            success = await self._cloud_call(device.turn_on)
+            if not success:
+                raise OutletConnectionError(f"Failed to turn on device {vesync_device_id}")
+            self._invalidate_state(account, vesync_device_id)
+            return True
             
         except OutletAuthenticationError:
             raise
@@ -222,27 +297,13 @@ class VeSyncDeviceService:
         """
         try:
             manager = await self._get_manager(account)
-            await asyncio.to_thread(manager.update)
-            
-            # Find and control device in outlets
-            if hasattr(manager, 'outlets') and manager.outlets:
-                for outlet in manager.outlets:
-                    if outlet.cid == vesync_device_id:
-                        success = await asyncio.to_thread(outlet.turn_off)
-                        if not success:
-                            raise OutletConnectionError(f"Failed to turn off device {vesync_device_id}")
-                        return True
-            
-            # Find and control device in switches
-            if hasattr(manager, 'switches') and manager.switches:
-                for switch in manager.switches:
-                    if switch.cid == vesync_device_id:
-                        success = await asyncio.to_thread(switch.turn_off)
-                        if not success:
-                            raise OutletConnectionError(f"Failed to turn off device {vesync_device_id}")
-                        return True
+            device = await self._find_device(manager, vesync_device_id)
             
-            raise OutletConnectionError(f"Device {vesync_device_id} not found")
+            success = await self._cloud_call(device.turn_off)
+            if not success:
+                raise OutletConnectionError(f"Failed to turn off device {vesync_device_id}")
+            self._invalidate_state(account, vesync_device_id)
+            return True
             
         except OutletAuthenticationError:
             raise
@@ -251,5 +312,18 @@ class VeSyncDeviceService:
             raise OutletConnectionError(f"Failed to turn off device: {str(e)}")
 
 
-# Global service instance
-vesync_device_service = VeSyncDeviceService() 
\ No newline at end of file
+# Process-wide service, created on first use rather than at import
+_vesync_device_service: Optional[VeSyncDeviceService] = None
+
+
+def get_vesync_device_service() -> VeSyncDeviceService:
+    """
+    Return the shared VeSyncDeviceService instance, creating it on first call.
+
+    Returns:
+        VeSyncDeviceService: The service instance
+    """
+    global _vesync_device_service
+    if _vesync_device_service is None:
+        _vesync_device_service = VeSyncDeviceService()
+    return _vesync_device_service
@@ -11,10 +11,10 @@ import os
 import sys
 from typing import Dict, Any
 
-# Add the current directory to the path so we can import our modules
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# Add the project root to the path so we can import the shared modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from db_encryption import EncryptedJSON
+from shared.db.db_encryption import EncryptedJSON
 from shared.core.config import settings
 
 
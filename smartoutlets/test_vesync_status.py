@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Test script for VeSync status fetch sharing.
+
+This script checks that concurrent state reads on one VeSyncDriver share a
+single cloud fetch, and that a caller timing out on the shared fetch does not
+cancel the other callers waiting on it.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+
+# Add the project root to the path so we can import the shared modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from smartoutlets.drivers.vesync import VeSyncDriver
+
+
+class FakeVeSyncDevice:
+    """Stands in for a pyvesync outlet; the first update() stalls for `first_delay` seconds."""
+
+    def __init__(self, first_delay: float = 0.0):
+        self.first_delay = first_delay
+        self.update_calls = 0
+        self.is_on = True
+        self.details = {'power': 12.5, 'voltage': 120.0, 'energy': 0.4}
+        self._calls_lock = threading.Lock()
+
+    def update(self):
+        with self._calls_lock:
+            self.update_calls += 1
+            call = self.update_calls
+        if call == 1 and self.first_delay:
+            time.sleep(self.first_delay)
+
+
+class FakeVeSyncDriver(VeSyncDriver):
+    """VeSyncDriver with the cloud login and device lookup replaced by a fake device."""
+
+    def __init__(self, device: FakeVeSyncDevice):
+        super().__init__("test-cid", "0.0.0.0", {"email": "test@example.com", "password": "secret"})
+        self._device = device
+
+    async def _get_device(self):
+        return self._device
+
+
+def test_concurrent_reads_share_one_fetch():
+    """Test that callers arriving during a fetch reuse it instead of calling the cloud again."""
+    print("Testing concurrent status reads share one fetch...")
+
+    async def run():
+        device = FakeVeSyncDevice(first_delay=0.2)
+        driver = FakeVeSyncDriver(device)
+        results = await asyncio.gather(*(driver._fetch_status() for _ in range(5)))
+        assert all(result['is_on'] for result in results)
+        assert device.update_calls == 1, f"expected 1 cloud call, got {device.update_calls}"
+
+    try:
+        asyncio.run(run())
+        print("  ✅ Five concurrent reads made one cloud call")
+        return True
+    except Exception as e:
+        print(f"  ❌ Shared fetch test failed: {e!r}")
+        return False
+
+
+def test_owner_timeout_does_not_cancel_waiters():
+    """Test that a waiter on the shared fetch survives the fetch owner's timeout."""
+    print("Testing owner timeout while another caller waits on the same fetch...")
+
+    async def run():
+        device = FakeVeSyncDevice(first_delay=0.5)
+        driver = FakeVeSyncDriver(device)
+
+        # The owner starts the fetch and gives up before the stalled update returns
+        owner = asyncio.create_task(asyncio.wait_for(driver._fetch_status(), timeout=0.1))
+        await asyncio.sleep(0.02)
+        assert driver._inflight_status is not None, "owner should have a fetch in flight"
+
+        # The waiter joins that fetch with a deadline long enough to fetch again itself
+        waiter = asyncio.create_task(asyncio.wait_for(driver._fetch_status(), timeout=2.0))
+
+        owner_result, waiter_result = await asyncio.gather(owner, waiter, return_exceptions=True)
+        assert isinstance(owner_result, asyncio.TimeoutError), f"owner got {owner_result!r}"
+        assert isinstance(waiter_result, dict), f"waiter got {waiter_result!r}"
+        assert waiter_result['is_on'] is True
+        assert device.update_calls == 2, f"expected a retried fetch, got {device.update_calls} calls"
+
+    try:
+        asyncio.run(run())
+        print("  ✅ Waiter re-fetched after the owner timed out")
+        return True
+    except Exception as e:
+        print(f"  ❌ Owner timeout test failed: {e!r}")
+        return False
+
+
+def main():
+    """Run all VeSync status fetch tests."""
+    print("SmartOutlets VeSync Status Test Suite")
+    print("=" * 40)
+
+    tests = [
+        test_concurrent_reads_share_one_fetch,
+        test_owner_timeout_does_not_cancel_waiters
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test in tests:
+        if test():
+            passed += 1
+        print()
+
+    print("=" * 40)
+    print(f"Test Results: {passed}/{total} tests passed")
+
+    if passed == total:
+        print("🎉 All tests passed! VeSync status fetch sharing is working correctly.")
+        return True
+    else:
+        print("❌ Some tests failed. Please check the implementation.")
+        return False
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -8,6 +8,8 @@ This worker implements the "Roll-up and Prune" strategy:
 3. Stores results in history_hourly_aggregates table
 4. Prunes the processed raw data to keep history table small
 
+Steps 2-4 run as one SQL statement, so the raw rows are scanned once.
+
 The worker processes data from the previous hour to ensure all data points
 are captured before aggregation.
 """
@@ -15,9 +17,8 @@ are captured before aggregation.
 import asyncio
 import logging
 import sys
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import List, Dict, Any
 
 # Add the project root to Python path
 project_root = Path(__file__).resolve().parent.parent
@@ -32,6 +33,54 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = get_logger(__name__)
 
+# Seconds after the hour boundary a cycle starts, so late writes for the closing hour land first
+CYCLE_GRACE_SECONDS = 30
+
+# Built once at import so each cycle reuses the same compiled statement (and,
+# on a pooled connection, asyncpg's prepared statement)
+_AGGREGATE_AND_PRUNE_SQL = text("""
+    WITH agg AS (
+        SELECT
+            device_id,
+            date_trunc('hour', timestamp) AS hour_timestamp,
+            AVG(value) AS avg_value,
+            MIN(value) AS min_value,
+            MAX(value) AS max_value,
+            COUNT(id) AS sample_count
+        FROM
+            history
+        WHERE
+            timestamp >= :start_time
+            AND timestamp < :end_time
+            AND value IS NOT NULL
+        GROUP BY
+            device_id, hour_timestamp
+    ),
+    ins AS (
+        INSERT INTO history_hourly_aggregates
+            (device_id, hour_timestamp, avg_value, min_value, max_value, sample_count)
+        SELECT device_id, hour_timestamp, avg_value, min_value, max_value, sample_count
+        FROM agg
+        ON CONFLICT (device_id, hour_timestamp)
+        DO UPDATE SET
+            avg_value = EXCLUDED.avg_value,
+            min_value = EXCLUDED.min_value,
+            max_value = EXCLUDED.max_value,
+            sample_count = EXCLUDED.sample_count,
+            created_at = NOW()
+        RETURNING 1
+    ),
+    del AS (
+        DELETE FROM history
+        WHERE timestamp >= :start_time
+        AND timestamp < :end_time
+        RETURNING 1
+    )
+    SELECT
+        (SELECT count(*) FROM ins) AS saved_count,
+        (SELECT count(*) FROM del) AS deleted_count
+""")
+
 
 class TelemetryAggregator:
     """Worker for aggregating telemetry data and pruning raw history."""
@@ -46,7 +95,7 @@ class TelemetryAggregator:
         Returns:
             tuple: (start_time, end_time) for the previous hour
         """
-        now = datetime.utcnow()
+        now = datetime.now(timezone.utc)
         # Round down to the nearest hour
         end_time = now.replace(minute=0, second=0, microsecond=0)
         # Previous hour
@@ -55,123 +104,33 @@ class TelemetryAggregator:
         self.logger.info(f"Aggregation time range: {start_time} to {end_time}")
         return start_time, end_time
     
-    async def aggregate_hourly_data(self, session: AsyncSession, start_time: datetime, end_time: datetime) -> List[Dict[str, Any]]:
-        """
-        Execute the aggregation query to calculate hourly statistics.
-        
-        Args:
-            session: Database session
-            start_time: Start of the hour to aggregate
-            end_time: End of the hour to aggregate
-            
-        Returns:
-            List of aggregated data records
-        """
-        query = text("""
-            SELECT
-                device_id,
-                date_trunc('hour', timestamp) AS hour_timestamp,
-                AVG(value) AS avg_value,
-                MIN(value) AS min_value,
-                MAX(value) AS max_value,
-                COUNT(id) AS sample_count
-            FROM
-                history
-            WHERE
-                timestamp >= :start_time 
-                AND timestamp < :end_time
-                AND value IS NOT NULL
-            GROUP BY
-                device_id, hour_timestamp
-            ORDER BY
-                device_id, hour_timestamp
-        """)
-        
-        result = await session.execute(query, {
-            "start_time": start_time,
-            "end_time": end_time
-        })
-        
-        aggregates = []
-        for row in result:
-            aggregates.append({
-                "device_id": row.device_id,
-                "hour_timestamp": row.hour_timestamp,
-                "avg_value": float(row.avg_value),
-                "min_value": float(row.min_value),
-                "max_value": float(row.max_value),
-                "sample_count": row.sample_count
-            })
-        
-        self.logger.info(f"Generated {len(aggregates)} hourly aggregates")
-        return aggregates
-    
-    async def save_aggregates(self, session: AsyncSession, aggregates: List[Dict[str, Any]]) -> int:
+    async def aggregate_and_prune(self, session: AsyncSession, start_time: datetime, end_time: datetime) -> tuple[int, int]:
         """
-        Save aggregated data to the history_hourly_aggregates table.
+        Roll up and prune one time range in a single statement.
         
-        Args:
-            session: Database session
-            aggregates: List of aggregated data records
-            
-        Returns:
-            Number of records saved
-        """
-        if not aggregates:
-            self.logger.info("No aggregates to save")
-            return 0
-        
-        # Use INSERT ... ON CONFLICT DO UPDATE to handle duplicates
-        insert_query = text("""
-            INSERT INTO history_hourly_aggregates 
-                (device_id, hour_timestamp, avg_value, min_value, max_value, sample_count)
-            VALUES 
-                (:device_id, :hour_timestamp, :avg_value, :min_value, :max_value, :sample_count)
-            ON CONFLICT (device_id, hour_timestamp) 
-            DO UPDATE SET
-                avg_value = EXCLUDED.avg_value,
-                min_value = EXCLUDED.min_value,
-                max_value = EXCLUDED.max_value,
-                sample_count = EXCLUDED.sample_count,
-                created_at = NOW()
-        """)
-        
-        saved_count = 0
-        for aggregate in aggregates:
-            await session.execute(insert_query, aggregate)
-            saved_count += 1
-        
-        await session.commit()
-        self.logger.info(f"Saved {saved_count} hourly aggregates")
-        return saved_count
-    
-    async def prune_raw_data(self, session: AsyncSession, start_time: datetime, end_time: datetime) -> int:
-        """
-        Delete the raw data that has been successfully aggregated.
+        The hourly statistics are computed, upserted into history_hourly_aggregates
+        and the raw rows deleted by data-modifying CTEs that share one snapshot, so
+        the range is scanned once and no aggregate rows travel through Python.
+        The caller commits.
         
         Args:
             session: Database session
-            start_time: Start of the time range to prune
-            end_time: End of the time range to prune
+            start_time: Start of the time range to process
+            end_time: End of the time range to process
             
         Returns:
-            Number of records deleted
+            tuple: (aggregates saved, raw records deleted)
         """
-        delete_query = text("""
-            DELETE FROM history 
-            WHERE timestamp >= :start_time 
-            AND timestamp < :end_time
-        """)
         
-        result = await session.execute(delete_query, {
+        result = await session.execute(_AGGREGATE_AND_PRUNE_SQL, {
             "start_time": start_time,
             "end_time": end_time
         })
+        saved_count, deleted_count = result.one()
         
-        await session.commit()
-        deleted_count = result.rowcount
+        self.logger.info(f"Saved {saved_count} hourly aggregates")
         self.logger.info(f"Pruned {deleted_count} raw history records")
-        return deleted_count
+        return saved_count, deleted_count
     
     async def run_aggregation_cycle(self) -> bool:
         """
@@ -184,21 +143,12 @@ class TelemetryAggregator:
             start_time, end_time = await self.get_aggregation_time_range()
             
             async with async_session() as session:
-                # Step 1: Aggregate the data
-                self.logger.info("Starting hourly data aggregation...")
-                aggregates = await self.aggregate_hourly_data(session, start_time, end_time)
+                self.logger.info("Aggregating and pruning hourly data...")
+                saved_count, deleted_count = await self.aggregate_and_prune(session, start_time, end_time)
+                await session.commit()
                 
-                if not aggregates:
+                if not saved_count:
                     self.logger.info("No data to aggregate for this time period")
-                    return True
-                
-                # Step 2: Save the aggregates
-                self.logger.info("Saving hourly aggregates...")
-                saved_count = await self.save_aggregates(session, aggregates)
-                
-                # Step 3: Prune the raw data
-                self.logger.info("Pruning processed raw data...")
-                deleted_count = await self.prune_raw_data(session, start_time, end_time)
                 
                 self.logger.info(f"Aggregation cycle complete: {saved_count} aggregates saved, {deleted_count} raw records pruned")
                 return True
@@ -222,10 +172,15 @@ class TelemetryAggregator:
                 if not success:
                     self.logger.error("Aggregation cycle failed, will retry on next interval")
                 
-                # Wait for the next cycle
-                interval_seconds = interval_hours * 3600
-                self.logger.info(f"Waiting {interval_hours} hour(s) until next aggregation cycle...")
-                await asyncio.sleep(interval_seconds)
+                # Wait for the next cycle, aligned to the hour so cycles don't drift
+                now = datetime.now(timezone.utc)
+                next_tick = (
+                    now.replace(minute=0, second=0, microsecond=0)
+                    + timedelta(hours=interval_hours, seconds=CYCLE_GRACE_SECONDS)
+                )
+                sleep_seconds = max(1.0, (next_tick - now).total_seconds())
+                self.logger.info(f"Waiting until {next_tick.isoformat()} for the next aggregation cycle...")
+                await asyncio.sleep(sleep_seconds)
                 
             except KeyboardInterrupt:
                 self.logger.info("Aggregator stopped by user")
@@ -261,4 +216,10 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    # uvloop ships with uvicorn[standard]; fall back to the default loop where it is unavailable
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
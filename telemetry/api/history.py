@@ -7,13 +7,13 @@ raw history and hourly aggregates tables for any device in the system.
 
 from datetime import datetime, date
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from shared.db.database import get_db
 from shared.crud.history import (
-    get_raw_history,
-    get_hourly_history,
+    get_raw_history_json,
+    get_hourly_history_json,
     get_device_by_id,
     get_raw_history_stats,
     get_hourly_history_stats
@@ -53,49 +53,43 @@ async def get_device_raw_history(
         raise HTTPException(status_code=404, detail=f"Device with ID {device_id} not found")
     
     try:
-        # Get raw history data
-        history_records = await get_raw_history(session, device_id, hours, limit)
+        # PostgreSQL returns the response array already encoded
+        history_json = await get_raw_history_json(session, device_id, hours, limit)
         
-        # Convert to response format
-        response_data = []
-        for record in history_records:
-            response_data.append({
-                "id": record.id,
-                "device_id": record.device_id,
-                "timestamp": record.timestamp,
-                "value": record.value,
-                "json_value": record.json_value,
-                "history_metadata": record.history_metadata
-            })
-        
-        logger.info(f"Retrieved {len(response_data)} raw history records for device {device_id}")
-        return response_data
+        logger.info(f"Retrieved raw history for device {device_id}")
+        return Response(content=history_json, media_type="application/json")
         
     except Exception as e:
         logger.error(f"Error fetching raw history for device {device_id}: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
-@router.get("/{device_id}/hourly", response_model=List[dict])
+@router.get("/{device_id}/hourly", response_model=dict)
 async def get_device_hourly_history(
     device_id: int,
     start_date: str = Query(..., description="Start date in YYYY-MM-DD format"),
     end_date: str = Query(..., description="End date in YYYY-MM-DD format"),
+    cursor: Optional[datetime] = Query(default=None, description="next_cursor from the previous page"),
+    limit: int = Query(default=500, ge=1, le=5000, description="Maximum records to return"),
     session: AsyncSession = Depends(get_db)
 ):
     """
-    Get hourly aggregated historical data for a device.
+    Get hourly aggregated historical data for a device, one page at a time.
     
     This endpoint fetches pre-calculated hourly averages from the
     history_hourly_aggregates table, perfect for long-term trend analysis.
+    Pass the returned next_cursor back as cursor to fetch the following page.
     
     Args:
         device_id: ID of the device
         start_date: Start date in YYYY-MM-DD format
         end_date: End date in YYYY-MM-DD format
+        cursor: Resume after this hour_timestamp (default: first page)
+        limit: Maximum number of records to return (default: 500, max: 5000)
         
     Returns:
-        List of hourly aggregated records with avg, min, max, and sample count
+        Object with "items" (hourly aggregated records with avg, min, max, and
+        sample count) and "next_cursor" (null when there are no more pages)
     """
     # Verify device exists
     device = await get_device_by_id(session, device_id)
@@ -113,25 +107,13 @@ async def get_device_hourly_history(
                 detail="Invalid date format. Use YYYY-MM-DD format (e.g., 2025-06-22)"
             )
         
-        # Get hourly history data
-        hourly_records = await get_hourly_history(session, device_id, start_date, end_date)
-        
-        # Convert to response format
-        response_data = []
-        for record in hourly_records:
-            response_data.append({
-                "id": record.id,
-                "device_id": record.device_id,
-                "hour_timestamp": record.hour_timestamp,
-                "avg_value": record.avg_value,
-                "min_value": record.min_value,
-                "max_value": record.max_value,
-                "sample_count": record.sample_count,
-                "created_at": record.created_at
-            })
+        # PostgreSQL returns the response array already encoded
+        hourly_json = await get_hourly_history_json(
+            session, device_id, start_date, end_date, cursor, limit
+        )
         
-        logger.info(f"Retrieved {len(response_data)} hourly history records for device {device_id}")
-        return response_data
+        logger.info(f"Retrieved hourly history for device {device_id}")
+        return Response(content=hourly_json, media_type="application/json")
         
     except HTTPException:
         raise